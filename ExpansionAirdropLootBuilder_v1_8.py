@@ -1,20 +1,44 @@
+import hashlib
 import json
+import multiprocessing
 import os
+import queue
 import shutil
+import struct
+import sys
+import threading
 import time
 import xml.etree.ElementTree as ET
-import webbrowser
+from bisect import bisect_left, bisect_right
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass
 
 import customtkinter as ctk
 import tkinter as tk
 from tkinter import filedialog, messagebox, simpledialog, ttk
 
-# Optional logo support (safe if PIL not installed or logo missing)
+# Optional fast XML parser (falls back to the stdlib ElementTree)
 try:
-    from PIL import Image
+    from lxml import etree as LET
 except Exception:
-    Image = None
+    LET = None
+
+# Optional fast JSON codecs (orjson, then ujson, then the stdlib json module)
+try:
+    import orjson
+except Exception:
+    orjson = None
+
+try:
+    import ujson
+except Exception:
+    ujson = None
+
+# Optional binary reload cache for airdrop files (skipped when msgpack is missing)
+try:
+    import msgpack
+except Exception:
+    msgpack = None
 
 
 APP_VERSION = "v1.8"
@@ -34,73 +58,214 @@ TV_ROW_ODD = "#0d1510"
 TV_HEAD_BG = "#0d1410"
 TV_BG = "#0f1712"
 TV_SEL = "#1a2a20"
+TV_ROW_HEIGHT = 26
 
 DISCORD_URL = "https://discord.gg/F9mTFPubhg"
 
+# msgpack copies of loaded airdrop files, reused while the JSON is unchanged.
+# Kept per-user so nothing extra lands in the server profile folder.
+CACHE_DIR = os.path.join(
+    os.environ.get("APPDATA") or os.path.join(os.path.expanduser("~"), ".cache"),
+    "KPTools", "AirdropLootBuilder"
+)
+CACHE_STAMP = struct.Struct("<qq")  # JSON file size, mtime_ns
+
 
 def ts_backup_name(path: str) -> str:
     stamp = time.strftime("%Y-%m-%d_%H%M%S")
     return f"{path}.bak_{stamp}"
 
 
-def safe_float(s: str, default: float = 0.0) -> float:
-    try:
-        return float(s)
-    except Exception:
-        return default
+# ASCII first characters float() can accept (digits, sign, dot, inf/nan)
+NUMERIC_START = frozenset("0123456789+-.iInN")
+
+
+def looks_numeric(s) -> bool:
+    # Cheap reject for blank / obviously non-numeric text, so the common
+    # bad-input path never has to raise and catch an exception. Non-ASCII
+    # starts (Unicode / full-width digits) are left for float() to judge.
+    if not isinstance(s, str):
+        return True
+    s = s.lstrip()
+    return bool(s) and (s[0] in NUMERIC_START or not s[0].isascii())
 
 
 def safe_int(s: str, default: int = 0) -> int:
+    if not looks_numeric(s):
+        return default
     try:
         return int(float(s))
     except Exception:
         return default
 
 
-@dataclass
+def var_number(var, default):
+    # DoubleVar/IntVar.get() raises on blank or non-numeric text
+    try:
+        return var.get()
+    except (tk.TclError, ValueError):
+        return default
+
+
+@dataclass(slots=True, frozen=True)
 class ItemMeta:
     category: str
     nominal: str
     min: str
-    tags: list
+    tags: tuple
     source: str
 
 
-def load_types_xml(path: str):
-    tree = ET.parse(path)
-    root = tree.getroot()
+def iter_type_elements(path: str):
+    # Stream <type> elements and free each one after the caller has read it,
+    # so peak memory stays flat on huge types.xml files.
+    if LET is not None:
+        for _evt, t in LET.iterparse(path, events=("end",), tag="type"):
+            yield t
+            t.clear()
+            while t.getprevious() is not None:
+                del t.getparent()[0]
+        return
+
+    for _evt, t in ET.iterparse(path, events=("end",)):
+        if t.tag == "type":
+            yield t
+            t.clear()
+
 
+def load_types_xml(path: str):
     classnames = []
     meta = {}
 
-    source_name = os.path.basename(path)
+    # Interned so repeated names/categories share one string object
+    source_name = sys.intern(os.path.basename(path))
 
-    for t in root.findall("type"):
+    for t in iter_type_elements(path):
         name = t.get("name")
         if not name:
             continue
-
-        category = (t.findtext("category") or "").strip()
-        nominal = (t.findtext("nominal") or "").strip()
-        minimum = (t.findtext("min") or "").strip()
-        tags = [x.text.strip() for x in t.findall("tag") if x.text and x.text.strip()]
+        name = sys.intern(name)
+
+        # One pass over the children instead of a find per field
+        # (first occurrence wins, like findtext did)
+        category = nominal = minimum = None
+        tags = []
+        for ch in t:
+            tg = ch.tag
+            if tg == "category":
+                if category is None:
+                    category = (ch.text or "").strip()
+            elif tg == "nominal":
+                if nominal is None:
+                    nominal = (ch.text or "").strip()
+            elif tg == "min":
+                if minimum is None:
+                    minimum = (ch.text or "").strip()
+            elif tg == "tag":
+                txt = ch.text
+                if txt:
+                    txt = txt.strip()
+                    if txt:
+                        tags.append(txt)
 
         classnames.append(name)
         meta[name] = ItemMeta(
-            category=category,
-            nominal=nominal,
-            min=minimum,
-            tags=tags,
+            category=sys.intern(category or ""),
+            nominal=nominal or "",
+            min=minimum or "",
+            tags=tuple(tags),
             source=source_name
         )
 
-    classnames = sorted(set(classnames), key=str.lower)
     return classnames, meta
 
 
+def read_json_file(path: str):
+    with open(path, "rb") as f:
+        raw = f.read()
+    if orjson is not None:
+        return orjson.loads(raw)
+    if ujson is not None:
+        return ujson.loads(raw)
+    return json.loads(raw)
+
+
+def write_json_file(path: str, data, pretty: bool = True):
+    # pretty=False writes compact JSON (smaller + faster on big configs)
+    if orjson is not None:
+        opt = orjson.OPT_INDENT_2 if pretty else orjson.OPT_APPEND_NEWLINE
+        buf = orjson.dumps(data, option=opt)
+    elif ujson is not None:
+        text = ujson.dumps(data, indent=2 if pretty else 0, escape_forward_slashes=False)
+        buf = (text + "\n").encode("utf-8")
+    elif pretty:
+        buf = json.dumps(data, indent=2).encode("utf-8")
+    else:
+        buf = (json.dumps(data, separators=(",", ":")) + "\n").encode("utf-8")
+    # Write a sibling temp file and swap it in, so closing the window (or a
+    # crash) mid-save can never leave a truncated airdrop file behind
+    tmp = path + ".tmp"
+    with open(tmp, "wb") as f:
+        f.write(buf)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp, path)
+
+
+def copy_json_tree(data):
+    # Deep copy that only rebuilds dicts/lists; str/int/float/bool/None are
+    # immutable and shared. Much cheaper than copy.deepcopy (no memo/reduce).
+    if type(data) is dict:
+        data = dict(data)
+        for k, v in data.items():
+            if type(v) is dict or type(v) is list:
+                data[k] = copy_json_tree(v)
+        return data
+    if type(data) is list:
+        return [copy_json_tree(v) if type(v) is dict or type(v) is list else v for v in data]
+    return data
+
+
+def airdrop_cache_path(path: str) -> str:
+    key = hashlib.sha1(os.path.normcase(os.path.abspath(path)).encode("utf-8")).hexdigest()
+    return os.path.join(CACHE_DIR, key + ".msgpack")
+
+
+def read_airdrop_cache(path: str, st):
+    # Cached document for path, or None if there is none or the JSON changed since
+    try:
+        with open(airdrop_cache_path(path), "rb") as f:
+            raw = f.read()
+        if CACHE_STAMP.unpack_from(raw) != (st.st_size, st.st_mtime_ns):
+            return None
+        return msgpack.unpackb(memoryview(raw)[CACHE_STAMP.size:], raw=False)
+    except Exception:
+        return None
+
+
+def write_airdrop_cache(path: str, blob: bytes, st=None):
+    # Best effort: a missing or stale cache only means the next load parses JSON
+    cache = airdrop_cache_path(path)
+    tmp = cache + ".tmp"
+    try:
+        if st is None:
+            st = os.stat(path)
+        os.makedirs(CACHE_DIR, exist_ok=True)
+        with open(tmp, "wb") as f:
+            f.write(CACHE_STAMP.pack(st.st_size, st.st_mtime_ns))
+            f.write(blob)
+        os.replace(tmp, cache)
+    except Exception:
+        pass
+
+
 def load_airdrop_json(path: str):
-    with open(path, "r", encoding="utf-8") as f:
-        data = json.load(f)
+    st = os.stat(path)
+    data = read_airdrop_cache(path, st) if msgpack is not None else None
+    if data is not None:
+        return data
+
+    data = read_json_file(path)
 
     if "Containers" not in data or not isinstance(data["Containers"], list):
         raise ValueError("This AirdropSettings.json does not have a 'Containers' array.")
@@ -114,9 +279,29 @@ def load_airdrop_json(path: str):
         if not isinstance(c.get("Loot"), list):
             c["Loot"] = []
 
+    # Only validated documents are cached, so a cache hit can skip the checks above
+    if msgpack is not None:
+        try:
+            write_airdrop_cache(path, msgpack.packb(data, use_bin_type=True), st)
+        except Exception:
+            pass
+
     return data
 
 
+def loot_row_values(entry: dict) -> tuple:
+    # Column values for one loot Treeview row
+    return (
+        str(entry.get("Name", "")),
+        entry.get("Chance", 0.0),
+        entry.get("Min", 0),
+        entry.get("Max", -1),
+        entry.get("QuantityPercent", -1.0),
+        len(entry.get("Attachments", []) or []),
+        len(entry.get("Variants", []) or []),
+    )
+
+
 def default_loot_entry(classname: str) -> dict:
     return {
         "Name": classname,
@@ -130,11 +315,20 @@ def default_loot_entry(classname: str) -> dict:
 
 
 def find_xml_files_in_folder(folder: str):
+    # scandir reuses the directory entry type, so no extra stat per file
     out = []
-    for root, _dirs, files in os.walk(folder):
-        for fn in files:
-            if fn.lower().endswith(".xml"):
-                out.append(os.path.join(root, fn))
+    stack = [folder]
+    while stack:
+        d = stack.pop()
+        try:
+            with os.scandir(d) as it:
+                for e in it:
+                    if e.is_dir(follow_symlinks=False):
+                        stack.append(e.path)
+                    elif e.name.lower().endswith(".xml") and e.is_file():
+                        out.append(e.path)
+        except OSError:
+            pass
     return sorted(out, key=str.lower)
 
 
@@ -164,26 +358,60 @@ class AirdropLootBuilder(ctk.CTk):
 
         self.types_folders = []
         self.types_files_loaded = []
+        self._types_files_loaded_set = set()
         self.all_items = []
         self.item_meta = {}
         self.source_to_items = {}
 
+        # Lowercased names parallel to all_items / source_to_items (search index).
+        # A source list is sorted + deduped the first time that file is browsed.
+        self._all_items_lc = []
+        self._source_items_lc = {}
+        # Every known classname, lowercased (case-insensitive "is this known?")
+        self._item_names_lc = frozenset()
+
+        # Parsed types files keyed by path -> ((mtime, size), items, meta)
+        self._xml_cache = {}
+        # Bumped by Clear Types so in-flight parses are dropped
+        self._types_gen = 0
+        # Worker pools still parsing (shut down + cancelled by Clear Types)
+        self._types_pools = []
+
         self.container_names = []
+        # Container name -> first index in container_names
+        self._container_name_to_idx = {}
         self.current_container_index = None
         self.selected_loot_index = None
 
-        # Pending container-level edits (committed ONLY on Save)
+        # Loot Treeview row values per id(container), kept in step with every
+        # add / edit / remove so the full list is only built once per container
+        self._loot_rows_cache = {}
+
+        # Virtual loot view: only rows [_loot_top, _loot_top + _loot_visible)
+        # of _loot_view_rows (the current container's cached rows) exist in the tree
+        self._loot_view_rows = []
+        self._loot_top = 0
+        self._loot_visible = 20
+        # Loot indices currently present as Treeview items
+        self._loot_shown = range(0)
+        # Last text pushed to lbl_status (identical updates are skipped)
+        self._status_text = None
+
+        # Pending container-level edits keyed by id(container) (committed ONLY
+        # on Save). Kept out of the JSON dicts so they can never be written.
         self.pending_container_settings = {}
 
-        # Chunked insertion state
-        self._loot_insert_job = None
-        self._loot_insert_idx = 0
-        self._loot_insert_list = None
+        # Debounced search (one filter pass per typing pause)
+        self._search_job = None
+        # Item browser rows, reused across filter passes (iids in display order)
+        self._item_rows = []
 
         # UI vars
         self.var_search = ctk.StringVar(value="")
+        self.var_search_mode = ctk.StringVar(value="Contains")
         self.var_source = ctk.StringVar(value="All Types Files")
         self.var_container = ctk.StringVar(value="Load airdrop file first")
+        self.var_pretty_save = ctk.BooleanVar(value=True)
 
         # Container-level settings (pending)
         self.var_item_count = ctk.StringVar(value="")
@@ -192,10 +420,11 @@ class AirdropLootBuilder(ctk.CTk):
 
         # Loot editor vars
         self.var_name = ctk.StringVar(value="")
-        self.var_chance = ctk.StringVar(value="")
-        self.var_min = ctk.StringVar(value="")
-        self.var_max = ctk.StringVar(value="")
-        self.var_qty = ctk.StringVar(value="")
+        # Typed vars: Tk converts the text on get(); blank until a row is selected
+        self.var_chance = ctk.DoubleVar(value="")
+        self.var_min = ctk.IntVar(value="")
+        self.var_max = ctk.IntVar(value="")
+        self.var_qty = ctk.DoubleVar(value="")
 
         self._build_ui()
         self._update_paths_label()
@@ -226,11 +455,20 @@ class AirdropLootBuilder(ctk.CTk):
             text_color=KP_TEXT, command=self.clear_types
         ).pack(side="left", padx=10, pady=10)
 
-        ctk.CTkButton(
+        self.btn_save = ctk.CTkButton(
             top, text="Save (Backup + Write)",
             fg_color=KP_GREEN_DARK, hover_color=KP_GREEN,
             text_color="black", command=self.save_airdrop
-        ).pack(side="left", padx=10, pady=10)
+        )
+        self.btn_save.pack(side="left", padx=10, pady=10)
+
+        ctk.CTkCheckBox(
+            top, text="Pretty JSON",
+            variable=self.var_pretty_save,
+            fg_color=KP_GREEN_DARK,
+            hover_color=KP_GREEN,
+            text_color=KP_TEXT
+        ).pack(side="left", padx=(0, 10), pady=10)
 
         self.lbl_paths = ctk.CTkLabel(top, text="No files loaded yet.", text_color=KP_MUTED)
         self.lbl_paths.pack(side="left", padx=14)
@@ -284,19 +522,64 @@ class AirdropLootBuilder(ctk.CTk):
             placeholder_text_color=KP_MUTED
         )
         ent.grid(row=0, column=0, sticky="ew")
-        ent.bind("<KeyRelease>", lambda e: self.refresh_item_filter())
+        ent.bind("<KeyRelease>", self._schedule_item_filter)
+
+        ctk.CTkOptionMenu(
+            search_row,
+            values=["Contains", "Starts with"],
+            variable=self.var_search_mode,
+            width=110,
+            fg_color=KP_PANEL_2,
+            button_color=KP_GREEN_DARK,
+            button_hover_color=KP_GREEN,
+            text_color=KP_TEXT,
+            dropdown_fg_color=KP_PANEL,
+            dropdown_text_color=KP_TEXT,
+            command=lambda _: self.refresh_item_filter()
+        ).grid(row=0, column=1, padx=(8, 0))
 
         ctk.CTkButton(
             search_row, text="Clear",
             fg_color=KP_PANEL_2, hover_color="#16251a",
             text_color=KP_TEXT, width=80,
             command=self.clear_search
-        ).grid(row=0, column=1, padx=(8, 0))
+        ).grid(row=0, column=2, padx=(8, 0))
 
-        self.items_frame = ctk.CTkScrollableFrame(left, fg_color=KP_PANEL_2, corner_radius=10)
-        self.items_frame.grid(row=4, column=0, sticky="nsew", padx=12, pady=(0, 12))
+        ctk.CTkButton(
+            left, text="+ Add Selected to Loot",
+            fg_color=KP_GREEN_DARK, hover_color=KP_GREEN,
+            text_color="black", command=self.add_selected_item_to_loot
+        ).grid(row=3, column=0, sticky="ew", padx=12, pady=(0, 8))
+
+        # Item list (Treeview only draws visible rows, unlike one widget per item)
+        items_host = ctk.CTkFrame(left, fg_color=KP_PANEL_2, corner_radius=10)
+        items_host.grid(row=4, column=0, sticky="nsew", padx=12, pady=(0, 12))
+        items_host.grid_rowconfigure(0, weight=1)
+        items_host.grid_columnconfigure(0, weight=1)
+
+        self.items_tree = ttk.Treeview(
+            items_host,
+            columns=("Name", "Source"),
+            show="headings",
+            selectmode="browse"
+        )
+        self.items_tree.heading("Name", text="Classname")
+        self.items_tree.heading("Source", text="Types File")
+        self.items_tree.column("Name", width=240, anchor="w")
+        self.items_tree.column("Source", width=120, anchor="w")
+
+        items_vsb = ttk.Scrollbar(items_host, orient="vertical", command=self.items_tree.yview)
+        self.items_tree.configure(yscrollcommand=items_vsb.set)
+
+        self.items_tree.grid(row=0, column=0, sticky="nsew", padx=(8, 0), pady=8)
+        items_vsb.grid(row=0, column=1, sticky="ns", padx=(0, 8), pady=8)
 
-        ctk.CTkLabel(left, text="Click + to add item to selected airdrop container.", text_color=KP_MUTED).grid(
+        self.items_tree.tag_configure("even", background=TV_ROW_EVEN)
+        self.items_tree.tag_configure("odd", background=TV_ROW_ODD)
+        self.items_tree.tag_configure("placeholder", foreground=KP_MUTED)
+        self.items_tree.bind("<Double-1>", self.add_selected_item_to_loot)
+
+        ctk.CTkLabel(left, text="Double-click an item to add it to the selected airdrop container.", text_color=KP_MUTED).grid(
             row=5, column=0, sticky="w", padx=12, pady=(0, 12)
         )
 
@@ -431,11 +714,11 @@ class AirdropLootBuilder(ctk.CTk):
             self.tree.heading(col, text=col)
             self.tree.column(col, width=w, anchor=anchor, stretch=stretch)
 
-        vsb = ttk.Scrollbar(tree_host, orient="vertical", command=self.tree.yview)
-        self.tree.configure(yscrollcommand=vsb.set)
+        # The scrollbar drives the virtual loot window, not the tree's own view
+        self.loot_vsb = ttk.Scrollbar(tree_host, orient="vertical", command=self._loot_yview)
 
         self.tree.grid(row=0, column=0, sticky="nsew", padx=(8, 0), pady=8)
-        vsb.grid(row=0, column=1, sticky="ns", padx=(0, 8), pady=8)
+        self.loot_vsb.grid(row=0, column=1, sticky="ns", padx=(0, 8), pady=8)
 
         style = ttk.Style()
         try:
@@ -447,7 +730,7 @@ class AirdropLootBuilder(ctk.CTk):
             background=TV_BG,
             fieldbackground=TV_BG,
             foreground=KP_TEXT,
-            rowheight=26,
+            rowheight=TV_ROW_HEIGHT,
             borderwidth=0
         )
         style.configure(
@@ -461,6 +744,14 @@ class AirdropLootBuilder(ctk.CTk):
         self.tree.tag_configure("even", background=TV_ROW_EVEN)
         self.tree.tag_configure("odd", background=TV_ROW_ODD)
         self.tree.bind("<<TreeviewSelect>>", self._on_tree_select)
+        self.tree.bind("<Configure>", self._on_loot_tree_configure)
+        self.tree.bind("<MouseWheel>", lambda e: self._loot_scroll_by(-3 if e.delta > 0 else 3))
+        self.tree.bind("<Button-4>", lambda _e: self._loot_scroll_by(-3))
+        self.tree.bind("<Button-5>", lambda _e: self._loot_scroll_by(3))
+        self.tree.bind("<Up>", lambda _e: self._loot_step_selection(-1))
+        self.tree.bind("<Down>", lambda _e: self._loot_step_selection(1))
+        self.tree.bind("<Prior>", lambda _e: self._loot_step_selection(-self._loot_visible))
+        self.tree.bind("<Next>", lambda _e: self._loot_step_selection(self._loot_visible))
 
         # Loot editor
         editor = ctk.CTkFrame(right, fg_color=KP_PANEL_2, corner_radius=10)
@@ -508,10 +799,12 @@ class AirdropLootBuilder(ctk.CTk):
         panel = ctk.CTkFrame(info, fg_color=KP_PANEL, corner_radius=12)
         panel.pack(fill="both", expand=True, padx=12, pady=12)
 
-        # Optional logo (expects kp_logo.png next to app)
+        # Optional logo (expects kp_logo.png next to app). PIL is only imported
+        # when there is a logo to show, so it stays off the startup path.
         logo_path = os.path.join(os.path.abspath(os.path.dirname(__file__)), "kp_logo.png")
-        if Image is not None and os.path.exists(logo_path):
+        if os.path.exists(logo_path):
             try:
+                from PIL import Image
                 img = Image.open(logo_path)
                 img.thumbnail((360, 360))
                 logo = ctk.CTkImage(light_image=img, dark_image=img, size=img.size)
@@ -556,7 +849,7 @@ class AirdropLootBuilder(ctk.CTk):
             hover_color=KP_GREEN,
             text_color="black",
             height=40,
-            command=lambda: webbrowser.open(DISCORD_URL)
+            command=self.open_discord
         ).pack(anchor="w", padx=16, pady=(0, 10))
 
         link_frame = ctk.CTkFrame(panel, fg_color=KP_PANEL_2, corner_radius=10)
@@ -572,16 +865,17 @@ class AirdropLootBuilder(ctk.CTk):
     # ---------------- Pending container settings ----------------
 
     def _stash_pending_container_settings(self):
-        if self.airdrop_data is None or self.current_container_index is None:
+        c = self.get_current_container()
+        if c is None:
             return
 
-        idx = self.current_container_index
+        key = id(c)
 
         item_count_str = (self.var_item_count.get() or "").strip()
         infected_count_str = (self.var_infected_count.get() or "").strip()
         infected_enabled = bool(self.var_infected_enabled.get())
 
-        pending = self.pending_container_settings.get(idx, {})
+        pending = self.pending_container_settings.get(key, {})
 
         if item_count_str != "":
             pending["ItemCount"] = safe_int(item_count_str, 0)
@@ -596,10 +890,10 @@ class AirdropLootBuilder(ctk.CTk):
         pending["Infected"] = infected_enabled
 
         if pending:
-            self.pending_container_settings[idx] = pending
+            self.pending_container_settings[key] = pending
             self.lbl_pending.configure(text="Pending changes ✓")
         else:
-            self.pending_container_settings.pop(idx, None)
+            self.pending_container_settings.pop(key, None)
             self.lbl_pending.configure(text="")
 
     def _load_container_settings_into_ui(self):
@@ -611,8 +905,7 @@ class AirdropLootBuilder(ctk.CTk):
             self.lbl_pending.configure(text="")
             return
 
-        idx = self.current_container_index
-        pending = self.pending_container_settings.get(idx)
+        pending = self.pending_container_settings.get(id(c))
 
         item_count = c.get("ItemCount", "")
         infected_count = c.get("InfectedCount", "")
@@ -634,16 +927,19 @@ class AirdropLootBuilder(ctk.CTk):
         if not self.airdrop_data:
             return
 
-        for idx, changes in list(self.pending_container_settings.items()):
-            if idx < 0 or idx >= len(self.airdrop_data["Containers"]):
-                continue
-            c = self.airdrop_data["Containers"][idx]
-            for k, v in changes.items():
-                c[k] = v
+        pending = self.pending_container_settings
+        for c in self.airdrop_data["Containers"]:
+            changes = pending.get(id(c))
+            if changes:
+                c.update(changes)
 
         self.pending_container_settings.clear()
         self.lbl_pending.configure(text="")
 
+    def open_discord(self):
+        import webbrowser
+        webbrowser.open(DISCORD_URL)
+
     # ---------------- File IO ----------------
 
     def load_airdrop(self):
@@ -663,11 +959,12 @@ class AirdropLootBuilder(ctk.CTk):
         self.airdrop_path = path
         self.airdrop_data = data
         self.pending_container_settings.clear()
+        self._loot_rows_cache.clear()
 
         self._rebuild_container_dropdown(select_index=0)
         self._update_paths_label()
         self._load_container_settings_into_ui()
-        self.refresh_loot_table_chunked()
+        self.refresh_loot_table()
 
     def save_airdrop(self):
         if not self.airdrop_data or not self.airdrop_path:
@@ -677,21 +974,57 @@ class AirdropLootBuilder(ctk.CTk):
         self._stash_pending_container_settings()
         self._commit_pending_container_settings_to_json()
 
+        # Backup + write run on a worker thread so big files don't freeze the UI.
+        # The thread gets a private copy taken now, so edits made while it runs
+        # can't end up in the file (they wait for the next Save).
+        data = copy_json_tree(self.airdrop_data)
+        result = {}
+        pretty = bool(self.var_pretty_save.get())
+        worker = threading.Thread(
+            target=self._save_worker, args=(self.airdrop_path, data, pretty, result), daemon=True
+        )
+        self.btn_save.configure(state="disabled")
+        worker.start()
+        self.after(50, self._poll_save, worker, result)
+
+    @staticmethod
+    def _save_worker(path, data, pretty, result):
         try:
-            bak = ts_backup_name(self.airdrop_path)
-            shutil.copy2(self.airdrop_path, bak)
+            bak = ts_backup_name(path)
+            shutil.copy2(path, bak)
         except Exception as e:
-            messagebox.showerror("Backup Error", f"Could not create backup:\n\n{e}")
+            result["error"] = ("Backup Error", f"Could not create backup:\n\n{e}")
             return
 
+        blob = None
+        if msgpack is not None:
+            try:
+                blob = msgpack.packb(data, use_bin_type=True)
+            except Exception:
+                blob = None
+
         try:
-            with open(self.airdrop_path, "w", encoding="utf-8") as f:
-                json.dump(self.airdrop_data, f, indent=2)
+            write_json_file(path, data, pretty)
         except Exception as e:
-            messagebox.showerror("Save Error", f"Could not write JSON:\n\n{e}")
+            result["error"] = ("Save Error", f"Could not write JSON:\n\n{e}")
+            return
+
+        if blob is not None:
+            write_airdrop_cache(path, blob)
+
+        result["backup"] = bak
+
+    def _poll_save(self, worker, result):
+        if worker.is_alive():
+            self.after(50, self._poll_save, worker, result)
             return
 
-        messagebox.showinfo("Saved", f"Saved successfully.\nBackup created:\n{bak}")
+        self.btn_save.configure(state="normal")
+        if "error" in result:
+            messagebox.showerror(*result["error"])
+            return
+
+        messagebox.showinfo("Saved", f"Saved successfully.\nBackup created:\n{result['backup']}")
 
     # ---------------- Types loading ----------------
 
@@ -707,14 +1040,21 @@ class AirdropLootBuilder(ctk.CTk):
             return
 
         self._merge_types_files(xmls)
-        self._update_paths_label()
 
     def clear_types(self):
+        self._types_gen += 1
+        for pool in self._types_pools:
+            pool.shutdown(wait=False, cancel_futures=True)
+        self._types_pools = []
         self.types_folders = []
         self.types_files_loaded = []
+        self._types_files_loaded_set = set()
         self.all_items = []
         self.item_meta.clear()
         self.source_to_items.clear()
+        self._all_items_lc = []
+        self._source_items_lc.clear()
+        self._item_names_lc = frozenset()
 
         self.dd_source.configure(values=["All Types Files"])
         self.var_source.set("All Types Files")
@@ -722,33 +1062,114 @@ class AirdropLootBuilder(ctk.CTk):
         self._update_paths_label()
 
     def _merge_types_files(self, paths):
-        merged_items = set(self.all_items)
+        # Unchanged files (same mtime + size) come from the cache; the rest are
+        # parsed in worker processes while the Tk loop keeps running.
+        parsed = [None] * len(paths)
         errors = []
+        jobs = []
 
-        for p in paths:
+        for i, p in enumerate(paths):
             try:
-                items, meta = load_types_xml(p)
-                src = os.path.basename(p)
-
-                self.source_to_items[src] = items
-                if p not in self.types_files_loaded:
-                    self.types_files_loaded.append(p)
+                st = os.stat(p)
+            except OSError as e:
+                errors.append(f"{os.path.basename(p)}: {e}")
+                continue
+            key = (st.st_mtime, st.st_size)
+            hit = self._xml_cache.get(p)
+            if hit is not None and hit[0] == key:
+                parsed[i] = (hit[1], hit[2])
+            else:
+                jobs.append((i, p, key))
+
+        if not jobs:
+            self._apply_types_files(paths, parsed, errors)
+            return
 
-                for k, v in meta.items():
-                    if k not in self.item_meta:
-                        self.item_meta[k] = v
+        # Each finished file lands on a queue (done-callbacks run on a pool
+        # thread); the Tk loop drains it so results are only touched here.
+        results = queue.Queue()
+        pool = ProcessPoolExecutor(max_workers=min(len(jobs), os.cpu_count() or 1))
+        for i, p, key in jobs:
+            f = pool.submit(load_types_xml, p)
+            f.add_done_callback(lambda f, i=i, p=p, key=key: results.put((i, p, key, f)))
+        pool.shutdown(wait=False)
+        self._types_pools.append(pool)
+
+        self.lbl_paths.configure(text=f"Parsing types files… (0 / {len(jobs)})")
+        self.after(50, self._drain_types_queue, self._types_gen, pool, paths, parsed, errors, results, len(jobs), 0)
+
+    def _drain_types_queue(self, gen, pool, paths, parsed, errors, results, total, done):
+        if gen != self._types_gen:
+            return
 
-                merged_items.update(items)
+        while True:
+            try:
+                i, p, key, f = results.get_nowait()
+            except queue.Empty:
+                break
+            done += 1
+            try:
+                items, meta = f.result()
             except Exception as e:
                 errors.append(f"{os.path.basename(p)}: {e}")
+                continue
+            # Results are unpickled per file, so re-intern here to share names
+            # and categories across every loaded types file
+            intern = sys.intern
+            items = [intern(n) for n in items]
+            meta = {
+                intern(k): ItemMeta(
+                    category=intern(v.category),
+                    nominal=v.nominal,
+                    min=v.min,
+                    tags=v.tags,
+                    source=v.source
+                )
+                for k, v in meta.items()
+            }
+            self._xml_cache[p] = (key, items, meta)
+            parsed[i] = (items, meta)
+
+        if done < total:
+            self.lbl_paths.configure(text=f"Parsing types files… ({done} / {total})")
+            self.after(50, self._drain_types_queue, gen, pool, paths, parsed, errors, results, total, done)
+            return
+
+        if pool in self._types_pools:
+            self._types_pools.remove(pool)
+        self._apply_types_files(paths, parsed, errors)
+
+    def _apply_types_files(self, paths, parsed, errors):
+        merged_items = set(self.all_items)
+
+        for p, result in zip(paths, parsed):
+            if result is None:
+                continue
+            items, meta = result
+            src = os.path.basename(p)
+
+            self.source_to_items[src] = items
+            self._source_items_lc.pop(src, None)
+            if p not in self._types_files_loaded_set:
+                self._types_files_loaded_set.add(p)
+                self.types_files_loaded.append(p)
+
+            for k, v in meta.items():
+                if k not in self.item_meta:
+                    self.item_meta[k] = v
+
+            merged_items.update(items)
 
         self.all_items = sorted(merged_items, key=str.lower)
+        self._all_items_lc = [n.lower() for n in self.all_items]
+        self._item_names_lc = frozenset(self._all_items_lc)
 
         sources = ["All Types Files"] + sorted(self.source_to_items.keys(), key=str.lower)
         self.dd_source.configure(values=sources)
         self.var_source.set("All Types Files")
 
         self.refresh_item_filter()
+        self._update_paths_label()
 
         if errors:
             messagebox.showwarning("Some files failed to load", "A few types files failed:\n\n" + "\n".join(errors))
@@ -758,12 +1179,14 @@ class AirdropLootBuilder(ctk.CTk):
     def _rebuild_container_dropdown(self, select_index=None):
         if not self.airdrop_data:
             self.container_names = []
+            self._container_name_to_idx = {}
             self.dd_container.configure(values=["Load airdrop file first"])
             self.var_container.set("Load airdrop file first")
             self.current_container_index = None
             return
 
         self.container_names = [c.get("Container", f"Container_{i}") for i, c in enumerate(self.airdrop_data["Containers"])]
+        self._index_container_names()
         values = self.container_names if self.container_names else ["(No containers)"]
         self.dd_container.configure(values=values)
 
@@ -778,6 +1201,27 @@ class AirdropLootBuilder(ctk.CTk):
         self.current_container_index = select_index
         self.var_container.set(self.container_names[select_index])
 
+    def _index_container_names(self):
+        self._container_name_to_idx = {}
+        for i, n in enumerate(self.container_names):
+            self._container_name_to_idx.setdefault(n, i)
+
+    # Add/remove touch one name instead of re-deriving the list from the JSON
+    def _append_container_to_dropdown(self, name):
+        idx = len(self.container_names)
+        self.container_names.append(name)
+        self._container_name_to_idx.setdefault(name, idx)
+        self.dd_container.configure(values=self.container_names)
+        self.current_container_index = idx
+        self.var_container.set(name)
+
+    def _remove_container_from_dropdown(self, removed_idx, select_index):
+        self.container_names.pop(removed_idx)
+        self._index_container_names()
+        self.dd_container.configure(values=self.container_names)
+        self.current_container_index = select_index
+        self.var_container.set(self.container_names[select_index])
+
     def add_container_clone(self):
         if not self.airdrop_data or not self.airdrop_data["Containers"]:
             messagebox.showwarning("No template", "Load a JSON with at least 1 container to clone.")
@@ -790,9 +1234,8 @@ class AirdropLootBuilder(ctk.CTk):
         if not template_name:
             return
 
-        try:
-            template_idx = self.container_names.index(template_name)
-        except ValueError:
+        template_idx = self._container_name_to_idx.get(template_name)
+        if template_idx is None:
             messagebox.showwarning("Template not found", "That template name is not in the current container list.")
             return
 
@@ -800,58 +1243,57 @@ class AirdropLootBuilder(ctk.CTk):
         if not new_name:
             return
 
-        existing = {c.get("Container", "") for c in self.airdrop_data["Containers"]}
-        if new_name in existing:
+        if new_name in self._container_name_to_idx:
             messagebox.showwarning("Name exists", "That container name already exists. Pick a unique name.")
             return
 
         clear_loot = messagebox.askyesno("Start empty?", "Clear Loot in the new container?\n\nYes = empty Loot\nNo = copy Loot too")
 
-        src = self.airdrop_data["Containers"][template_idx]
-        clone = json.loads(json.dumps(src))
+        containers = self.airdrop_data["Containers"]
+        clone = copy_json_tree(containers[template_idx])
         clone["Container"] = new_name
         clone.setdefault("Loot", [])
         if clear_loot:
             clone["Loot"] = []
 
-        self.airdrop_data["Containers"].append(clone)
-        self._rebuild_container_dropdown(select_index=len(self.airdrop_data["Containers"]) - 1)
+        containers.append(clone)
+        self._append_container_to_dropdown(new_name)
 
         self.selected_loot_index = None
         self._clear_editor()
         self._load_container_settings_into_ui()
-        self.refresh_loot_table_chunked()
+        self.refresh_loot_table()
 
     def duplicate_container(self):
         if not self.airdrop_data or self.current_container_index is None:
             return
 
-        src = self.airdrop_data["Containers"][self.current_container_index]
+        containers = self.airdrop_data["Containers"]
+        src = containers[self.current_container_index]
         base_name = src.get("Container", "Container")
         new_name = simpledialog.askstring("Duplicate Airdrop", f"New name for copy of '{base_name}':")
         if not new_name:
             return
 
-        existing = {c.get("Container", "") for c in self.airdrop_data["Containers"]}
-        if new_name in existing:
+        if new_name in self._container_name_to_idx:
             messagebox.showwarning("Name exists", "That container name already exists. Pick a unique name.")
             return
 
         clear_loot = messagebox.askyesno("Start empty?", "Clear Loot in the new container?\n\nYes = empty Loot\nNo = copy Loot too")
 
-        clone = json.loads(json.dumps(src))
+        clone = copy_json_tree(src)
         clone["Container"] = new_name
         clone.setdefault("Loot", [])
         if clear_loot:
             clone["Loot"] = []
 
-        self.airdrop_data["Containers"].append(clone)
-        self._rebuild_container_dropdown(select_index=len(self.airdrop_data["Containers"]) - 1)
+        containers.append(clone)
+        self._append_container_to_dropdown(new_name)
 
         self.selected_loot_index = None
         self._clear_editor()
         self._load_container_settings_into_ui()
-        self.refresh_loot_table_chunked()
+        self.refresh_loot_table()
 
     def remove_container(self):
         if not self.airdrop_data or self.current_container_index is None:
@@ -862,32 +1304,25 @@ class AirdropLootBuilder(ctk.CTk):
             return
 
         removed_idx = self.current_container_index
-        self.pending_container_settings.pop(removed_idx, None)
-        self.airdrop_data["Containers"].pop(removed_idx)
-
-        new_pending = {}
-        for idx, changes in self.pending_container_settings.items():
-            if idx < removed_idx:
-                new_pending[idx] = changes
-            elif idx > removed_idx:
-                new_pending[idx - 1] = changes
-        self.pending_container_settings = new_pending
-
-        if len(self.airdrop_data["Containers"]) == 0:
+        containers = self.airdrop_data["Containers"]
+        removed = containers.pop(removed_idx)
+        self._loot_rows_cache.pop(id(removed), None)
+        self.pending_container_settings.pop(id(removed), None)
+
+        if not containers:
             self.current_container_index = None
             self._rebuild_container_dropdown(select_index=None)
-            self.tree.delete(*self.tree.get_children())
+            self.refresh_loot_table()
             self._clear_editor()
             self._load_container_settings_into_ui()
             return
 
-        new_index = min(removed_idx, len(self.airdrop_data["Containers"]) - 1)
-        self._rebuild_container_dropdown(select_index=new_index)
+        self._remove_container_from_dropdown(removed_idx, min(removed_idx, len(containers) - 1))
 
         self.selected_loot_index = None
         self._clear_editor()
         self._load_container_settings_into_ui()
-        self.refresh_loot_table_chunked()
+        self.refresh_loot_table()
 
     def clear_current_loot(self):
         c = self.get_current_container()
@@ -896,9 +1331,10 @@ class AirdropLootBuilder(ctk.CTk):
         if not messagebox.askyesno("Clear Loot", "Remove ALL loot entries for this container?"):
             return
         c["Loot"] = []
+        self._loot_rows_cache.pop(id(c), None)
         self.selected_loot_index = None
         self._clear_editor()
-        self.refresh_loot_table_chunked()
+        self.refresh_loot_table()
 
     def on_container_change(self, _value=None):
         if not self.airdrop_data:
@@ -906,82 +1342,146 @@ class AirdropLootBuilder(ctk.CTk):
         self._stash_pending_container_settings()
 
         selected = self.var_container.get()
-        if selected in self.container_names:
-            self.current_container_index = self.container_names.index(selected)
+        idx = self._container_name_to_idx.get(selected)
+        if idx is not None:
+            self.current_container_index = idx
             self.selected_loot_index = None
             self._clear_editor()
             self._load_container_settings_into_ui()
-            self.refresh_loot_table_chunked()
+            self.refresh_loot_table()
 
     def get_current_container(self):
         if self.airdrop_data is None or self.current_container_index is None:
             return None
         return self.airdrop_data["Containers"][self.current_container_index]
 
-    # ---------------- Loot Treeview (FAST + chunked) ----------------
-
-    def _cancel_loot_job(self):
-        if self._loot_insert_job is not None:
-            try:
-                self.after_cancel(self._loot_insert_job)
-            except Exception:
-                pass
-        self._loot_insert_job = None
-        self._loot_insert_idx = 0
-        self._loot_insert_list = None
-
-    def refresh_loot_table_chunked(self):
-        self._cancel_loot_job()
-        self.tree.delete(*self.tree.get_children())
+    # ---------------- Loot Treeview ----------------
 
+    def refresh_loot_table(self, keep_scroll=False):
+        rows = []
         c = self.get_current_container()
-        if not c:
-            return
+        if c:
+            loot = c.get("Loot", [])
+            if not isinstance(loot, list):
+                loot = []
+                c["Loot"] = loot
+
+            # Row tuples are built once per container and reused on every redraw
+            rows = self._loot_rows_cache.get(id(c))
+            if rows is None or len(rows) != len(loot):
+                rows = [loot_row_values(e) for e in loot]
+                self._loot_rows_cache[id(c)] = rows
+
+        self._loot_view_rows = rows
+        if not keep_scroll:
+            self._loot_top = 0
+        self._loot_top = self._clamp_loot_top(self._loot_top)
+        self._render_loot_window()
+
+        if c:
+            self._update_loot_status()
+
+    def _update_loot_status(self):
+        text = f"Loaded loot: {len(self._loot_view_rows)} entries. (Settings commit on Save)"
+        # Every configure is a Tcl round-trip + redraw; skip it when nothing changed
+        if text != self._status_text:
+            self._status_text = text
+            self.lbl_status.configure(text=text)
+
+    def _clamp_loot_top(self, top):
+        return max(0, min(top, len(self._loot_view_rows) - self._loot_visible))
+
+    def _render_loot_window(self, scrolled=False):
+        # Only the rows in the viewport are real Treeview items (iid = loot index)
+        tree = self.tree
+        rows = self._loot_view_rows
+        n = len(rows)
+        top = self._loot_top
+        end = min(top + self._loot_visible, n)
+        shown = self._loot_shown
+
+        # Raw Tcl inserts skip ttk's per-call option formatting; prepending
+        # avoids Tk walking the sibling list to find "end" on every row
+        # (-id takes the int directly; Tcl stringifies it, so no str() per row)
+        call = tree.tk.call
+        w = tree._w
+        zebra = ("even", "odd")
+
+        if scrolled and shown.start < end and top < shown.stop:
+            # Pure scroll that overlaps the old window: the shared rows are
+            # unchanged, so only drop the rows that left and add the new ones
+            gone = [i for i in shown if i < top or i >= end]
+            if gone:
+                tree.delete(*gone)
+            for idx in range(min(shown.start, end) - 1, top - 1, -1):
+                call(w, "insert", "", 0, "-id", idx, "-values", rows[idx], "-tags", zebra[idx & 1])
+            for idx in range(max(shown.stop, top), end):
+                call(w, "insert", "", "end", "-id", idx, "-values", rows[idx], "-tags", zebra[idx & 1])
+        else:
+            # We know exactly which items exist, so no get_children() round-trip
+            if shown:
+                tree.delete(*shown)
+            for idx in range(end - 1, top - 1, -1):
+                call(w, "insert", "", 0, "-id", idx, "-values", rows[idx], "-tags", zebra[idx & 1])
+        self._loot_shown = range(top, end)
+
+        sel = self.selected_loot_index
+        if sel is not None and top <= sel < end:
+            tree.selection_set(str(sel))
+
+        if n:
+            self.loot_vsb.set(top / n, end / n)
+        else:
+            self.loot_vsb.set(0.0, 1.0)
 
-        loot = c.get("Loot", [])
-        if not isinstance(loot, list):
-            loot = []
-            c["Loot"] = loot
-
-        self._loot_insert_list = loot
-        self._loot_insert_idx = 0
-        self.lbl_status.configure(text=f"Loading loot… (0 / {len(loot)})")
-        self._loot_insert_job = self.after(1, self._loot_insert_step)
-
-    def _loot_insert_step(self):
-        loot = self._loot_insert_list or []
-        n = len(loot)
-        i = self._loot_insert_idx
-
-        BATCH = 250
-        end = min(i + BATCH, n)
-
-        for idx in range(i, end):
-            entry = loot[idx]
-            name = str(entry.get("Name", ""))
-            chance = entry.get("Chance", 0.0)
-            mn = entry.get("Min", 0)
-            mx = entry.get("Max", -1)
-            qty = entry.get("QuantityPercent", -1.0)
-            att = len(entry.get("Attachments", []) or [])
-            var = len(entry.get("Variants", []) or [])
-
-            tag = "even" if idx % 2 == 0 else "odd"
-            self.tree.insert(
-                "", "end",
-                iid=str(idx),
-                values=(name, chance, mn, mx, qty, att, var),
-                tags=(tag,)
-            )
+    def _loot_scroll_to(self, top):
+        top = self._clamp_loot_top(top)
+        if top != self._loot_top:
+            self._loot_top = top
+            self._render_loot_window(scrolled=True)
+        return "break"
+
+    def _loot_scroll_by(self, rows):
+        return self._loot_scroll_to(self._loot_top + rows)
 
-        self._loot_insert_idx = end
-        if end >= n:
-            self._loot_insert_job = None
-            self.lbl_status.configure(text=f"Loaded loot: {n} entries. (Settings commit on Save)")
+    def _loot_yview(self, *args):
+        # Scrollbar protocol: ("moveto", fraction) or ("scroll", n, "units"/"pages")
+        if not args:
             return
+        if args[0] == "moveto":
+            self._loot_scroll_to(int(float(args[1]) * len(self._loot_view_rows)))
+        elif args[0] == "scroll":
+            step = self._loot_visible if args[2].startswith("page") else 1
+            self._loot_scroll_by(int(args[1]) * step)
+
+    def _on_loot_tree_configure(self, evt):
+        # Count whole rows below the heading (assumed about one row tall)
+        visible = max(1, (evt.height - TV_ROW_HEIGHT) // TV_ROW_HEIGHT)
+        if visible != self._loot_visible:
+            self._loot_visible = visible
+            self._loot_top = self._clamp_loot_top(self._loot_top)
+            self._render_loot_window()
+
+    def _loot_select(self, idx):
+        # Scroll idx into the viewport, then make it the selected loot entry
+        if idx < self._loot_top:
+            self._loot_top = idx
+        elif idx >= self._loot_top + self._loot_visible:
+            self._loot_top = idx - self._loot_visible + 1
+        self._loot_top = self._clamp_loot_top(self._loot_top)
 
-        self.lbl_status.configure(text=f"Loading loot… ({end} / {n})")
-        self._loot_insert_job = self.after(1, self._loot_insert_step)
+        self.selected_loot_index = idx
+        self._render_loot_window()
+        self.tree.focus(str(idx))
+        self.populate_editor_from_selected()
+
+    def _loot_step_selection(self, delta):
+        n = len(self._loot_view_rows)
+        if n:
+            cur = self.selected_loot_index
+            idx = self._loot_top if cur is None else cur + delta
+            self._loot_select(min(max(idx, 0), n - 1))
+        return "break"
 
     def _on_tree_select(self, _evt=None):
         sel = self.tree.selection()
@@ -991,6 +1491,9 @@ class AirdropLootBuilder(ctk.CTk):
             idx = int(sel[0])
         except Exception:
             return
+        # Redrawing the viewport re-selects the current row; nothing changed
+        if idx == self.selected_loot_index:
+            return
         self.selected_loot_index = idx
         self.populate_editor_from_selected()
 
@@ -1002,26 +1505,13 @@ class AirdropLootBuilder(ctk.CTk):
             messagebox.showwarning("No Container", "Load AirdropSettings.json and select a container first.")
             return
 
-        c.setdefault("Loot", [])
-        c["Loot"].append(default_loot_entry(classname))
-
-        idx = len(c["Loot"]) - 1
-        entry = c["Loot"][idx]
-        tag = "even" if idx % 2 == 0 else "odd"
-        self.tree.insert("", "end", iid=str(idx), values=(
-            entry.get("Name", ""),
-            entry.get("Chance", 0.0),
-            entry.get("Min", 0),
-            entry.get("Max", -1),
-            entry.get("QuantityPercent", -1.0),
-            0,
-            0,
-        ), tags=(tag,))
-
-        self.tree.selection_set(str(idx))
-        self.tree.see(str(idx))
-        self.selected_loot_index = idx
-        self.populate_editor_from_selected()
+        loot = c.setdefault("Loot", [])
+        entry = default_loot_entry(classname)
+        loot.append(entry)
+
+        self._loot_view_rows.append(loot_row_values(entry))
+        self._loot_select(len(loot) - 1)
+        self._update_loot_status()
 
     def remove_selected_loot(self):
         c = self.get_current_container()
@@ -1036,7 +1526,18 @@ class AirdropLootBuilder(ctk.CTk):
         loot.pop(idx)
         self.selected_loot_index = None
         self._clear_editor()
-        self.refresh_loot_table_chunked()
+
+        # Drop the one cached row and redraw just the viewport; iids are loot
+        # indices, so the rows below the removed one renumber on redraw
+        rows = self._loot_view_rows
+        if len(rows) != len(loot) + 1:
+            self._loot_rows_cache.pop(id(c), None)
+            self.refresh_loot_table(keep_scroll=True)
+            return
+        rows.pop(idx)
+        self._loot_top = self._clamp_loot_top(self._loot_top)
+        self._render_loot_window()
+        self._update_loot_status()
 
     def duplicate_selected_loot(self):
         c = self.get_current_container()
@@ -1048,27 +1549,12 @@ class AirdropLootBuilder(ctk.CTk):
         if idx < 0 or idx >= len(loot):
             return
 
-        entry = json.loads(json.dumps(loot[idx]))
+        entry = copy_json_tree(loot[idx])
         loot.append(entry)
 
-        new_idx = len(loot) - 1
-        tag = "even" if new_idx % 2 == 0 else "odd"
-        att = len(entry.get("Attachments", []) or [])
-        var = len(entry.get("Variants", []) or [])
-        self.tree.insert("", "end", iid=str(new_idx), values=(
-            entry.get("Name", ""),
-            entry.get("Chance", 0.0),
-            entry.get("Min", 0),
-            entry.get("Max", -1),
-            entry.get("QuantityPercent", -1.0),
-            att,
-            var
-        ), tags=(tag,))
-
-        self.tree.selection_set(str(new_idx))
-        self.tree.see(str(new_idx))
-        self.selected_loot_index = new_idx
-        self.populate_editor_from_selected()
+        self._loot_view_rows.append(loot_row_values(entry))
+        self._loot_select(len(loot) - 1)
+        self._update_loot_status()
 
     # ---------------- Loot editor ----------------
 
@@ -1093,10 +1579,10 @@ class AirdropLootBuilder(ctk.CTk):
 
         entry = loot[idx]
         self.var_name.set(entry.get("Name", ""))
-        self.var_chance.set(str(entry.get("Chance", 0.0)))
-        self.var_min.set(str(entry.get("Min", 0)))
-        self.var_max.set(str(entry.get("Max", -1)))
-        self.var_qty.set(str(entry.get("QuantityPercent", -1.0)))
+        self.var_chance.set(entry.get("Chance", 0.0))
+        self.var_min.set(entry.get("Min", 0))
+        self.var_max.set(entry.get("Max", -1))
+        self.var_qty.set(entry.get("QuantityPercent", -1.0))
 
     def apply_editor_to_selected(self):
         c = self.get_current_container()
@@ -1113,7 +1599,7 @@ class AirdropLootBuilder(ctk.CTk):
             messagebox.showwarning("Invalid Name", "Name cannot be empty.")
             return
 
-        if self.item_meta and name not in self.item_meta:
+        if self._item_names_lc and name.lower() not in self._item_names_lc:
             if not messagebox.askyesno(
                 "Unknown Classname",
                 "This classname was not found in the loaded types.xml files.\n\nSave anyway?"
@@ -1122,16 +1608,22 @@ class AirdropLootBuilder(ctk.CTk):
 
         entry = loot[idx]
         entry["Name"] = name
-        entry["Chance"] = safe_float(self.var_chance.get(), entry.get("Chance", 0.1))
-        entry["Min"] = safe_int(self.var_min.get(), entry.get("Min", 0))
-        entry["Max"] = safe_int(self.var_max.get(), entry.get("Max", -1))
-        entry["QuantityPercent"] = safe_float(self.var_qty.get(), entry.get("QuantityPercent", -1.0))
-
-        att = len(entry.get("Attachments", []) or [])
-        var = len(entry.get("Variants", []) or [])
-        self.tree.item(str(idx), values=(
-            entry["Name"], entry["Chance"], entry["Min"], entry["Max"], entry["QuantityPercent"], att, var
-        ))
+        entry["Chance"] = var_number(self.var_chance, entry.get("Chance", 0.1))
+        entry["Min"] = var_number(self.var_min, entry.get("Min", 0))
+        entry["Max"] = var_number(self.var_max, entry.get("Max", -1))
+        entry["QuantityPercent"] = var_number(self.var_qty, entry.get("QuantityPercent", -1.0))
+
+        # The editor never touches Attachments/Variants, so keep the cached counts
+        rows = self._loot_view_rows
+        if idx < len(rows):
+            values = (
+                str(entry["Name"]), entry["Chance"], entry["Min"], entry["Max"], entry["QuantityPercent"]
+            ) + rows[idx][5:]
+            rows[idx] = values
+        else:
+            values = loot_row_values(entry)
+        if self.tree.exists(str(idx)):
+            self.tree.item(str(idx), values=values)
 
 
 
@@ -1141,7 +1633,27 @@ class AirdropLootBuilder(ctk.CTk):
         self.var_search.set("")
         self.refresh_item_filter()
 
+    def _schedule_item_filter(self, _evt=None):
+        if self._search_job is not None:
+            self.after_cancel(self._search_job)
+        self._search_job = self.after(150, self.refresh_item_filter)
+
+    def _source_items(self, src: str):
+        if src not in self.source_to_items:
+            return [], []
+
+        base_lc = self._source_items_lc.get(src)
+        if base_lc is None:
+            base = sorted(set(self.source_to_items[src]), key=str.lower)
+            self.source_to_items[src] = base
+            base_lc = self._source_items_lc[src] = [n.lower() for n in base]
+        return self.source_to_items[src], base_lc
+
     def refresh_item_filter(self):
+        if self._search_job is not None:
+            self.after_cancel(self._search_job)
+            self._search_job = None
+
         q = self.var_search.get().strip().lower()
         src = self.var_source.get()
 
@@ -1149,44 +1661,72 @@ class AirdropLootBuilder(ctk.CTk):
             self._render_items(["(Add a folder with types.xml files to browse items)"])
             return
 
-        base = self.all_items if src == "All Types Files" else self.source_to_items.get(src, [])
-        filtered = base if not q else [x for x in base if q in x.lower()]
+        if src == "All Types Files":
+            base, base_lc = self.all_items, self._all_items_lc
+        else:
+            base, base_lc = self._source_items(src)
+        if not q:
+            filtered = base
+        elif self.var_search_mode.get() == "Starts with":
+            # base_lc is sorted, so prefix matches are one contiguous slice
+            lo = bisect_left(base_lc, q)
+            hi = bisect_right(base_lc, q + "\uffff", lo)
+            filtered = base[lo:hi]
+        else:
+            filtered = [n for n, lc in zip(base, base_lc) if q in lc]
         # cap to keep UI snappy
         self._render_items(filtered[:900])
 
     def _render_items(self, items):
-        for child in self.items_frame.winfo_children():
-            child.destroy()
+        # Rewrite the existing rows in place and only insert/delete the
+        # difference, instead of rebuilding the whole list per keystroke
+        tree = self.items_tree
+        pool = self._item_rows
 
+        # Placeholders only ever come as a single "(...)" line (or no items)
+        placeholder = None
         if not items:
-            ctk.CTkLabel(self.items_frame, text="No matches.", text_color=KP_MUTED).pack(anchor="w", padx=10, pady=10)
-            return
+            placeholder = "No matches."
+        elif len(items) == 1 and items[0].startswith("(") and items[0].endswith(")"):
+            placeholder = items[0]
 
-        for name in items:
-            if name.startswith("(") and name.endswith(")"):
-                ctk.CTkLabel(self.items_frame, text=name, text_color=KP_MUTED).pack(anchor="w", padx=10, pady=10)
-                continue
-
-            meta = self.item_meta.get(name)
-            src = meta.source if meta else ""
-
-            row = ctk.CTkFrame(self.items_frame, fg_color=KP_PANEL, corner_radius=10)
-            row.pack(fill="x", padx=8, pady=4)
-
-            left = ctk.CTkFrame(row, fg_color="transparent")
-            left.pack(side="left", fill="x", expand=True, padx=10, pady=8)
-
-            ctk.CTkLabel(left, text=name, text_color=KP_TEXT, font=("Segoe UI", 12, "bold")).pack(anchor="w")
-            if src:
-                ctk.CTkLabel(left, text=src, text_color=KP_MUTED, font=("Segoe UI", 11)).pack(anchor="w")
-
-            ctk.CTkButton(
-                row, text="+",
-                width=44,
-                fg_color=KP_GREEN_DARK, hover_color=KP_GREEN,
-                text_color="black",
-                command=lambda n=name: self.add_item_to_loot(n)
-            ).pack(side="right", padx=10, pady=10)
+        if placeholder is not None:
+            rows = [((placeholder, ""), ("placeholder",))]
+        else:
+            meta_get = self.item_meta.get
+            zebra = (("even",), ("odd",))
+            rows = []
+            for i, name in enumerate(items):
+                meta = meta_get(name)
+                rows.append(((name, meta.source if meta else ""), zebra[i & 1]))
+
+        n_pool = len(pool)
+        for i, (values, tags) in enumerate(rows):
+            if i < n_pool:
+                tree.item(pool[i], values=values, tags=tags)
+            else:
+                pool.append(tree.insert("", "end", values=values, tags=tags))
+
+        if len(pool) > len(rows):
+            tree.delete(*pool[len(rows):])
+            del pool[len(rows):]
+
+        # Reused rows now hold different names, so drop any stale selection
+        sel = tree.selection()
+        if sel:
+            tree.selection_remove(*sel)
+        tree.yview_moveto(0)
+
+    def add_selected_item_to_loot(self, evt=None):
+        tree = self.items_tree
+        if evt is not None:
+            iid = tree.identify_row(evt.y)
+        else:
+            sel = tree.selection()
+            iid = sel[0] if sel else ""
+        if not iid or tree.tag_has("placeholder", iid):
+            return
+        self.add_item_to_loot(tree.set(iid, "Name"))
 
     def _update_paths_label(self):
         ap = os.path.basename(self.airdrop_path) if self.airdrop_path else "None"
@@ -1197,5 +1737,6 @@ class AirdropLootBuilder(ctk.CTk):
 
 
 if __name__ == "__main__":
+    multiprocessing.freeze_support()
     app = AirdropLootBuilder()
     app.mainloop()
@@ -1,10 +1,22 @@
+import hashlib
 import json
+import multiprocessing
 import os
+import pickle
+import queue
 import shutil
+import sys
+import threading
 import time
 import xml.etree.ElementTree as ET
 import webbrowser
+from array import array
+from bisect import bisect_left, bisect_right, insort
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass
+from itertools import islice
+from operator import itemgetter
 
 import customtkinter as ctk
 import tkinter as tk
@@ -16,6 +28,18 @@ try:
 except Exception:
     Image = None
 
+# Optional fast XML parser (falls back to the stdlib ElementTree)
+try:
+    from lxml import etree as LET
+except Exception:
+    LET = None
+
+# Optional fast JSON codec (falls back to the stdlib json module)
+try:
+    import orjson
+except Exception:
+    orjson = None
+
 """
 KPTools - Expansion Airdrop Loot Builder
 v2.0
@@ -44,12 +68,39 @@ TV_ROW_ODD = "#0d1510"
 TV_HEAD_BG = "#0d1410"
 TV_BG = "#0f1712"
 TV_SEL = "#1a2a20"
+TV_ROW_HEIGHT = 22
+
+# Zebra tag tuples by row parity (row & 1), shared by every insert
+ZEBRA_TAGS = (("even",), ("odd",))
+# Sorts after every character, so q + PREFIX_END bounds all names starting with q
+PREFIX_END = "\U0010ffff"
+# Quiet time after the last keystroke before a browser search re-filters
+SEARCH_DEBOUNCE_MS = 180
+# Loot rows inserted per idle callback when filling the loot table
+LOOT_CHUNK_ROWS = 100
 
 DISCORD_URL = "https://discord.gg/F9mTFPubhg"
 
+# Per-user cache files (same fallback as v1.8 when APPDATA isn't set). Only
+# regenerable data goes here; config.json stays in config_dir.
+CACHE_ROOT = os.path.join(
+    os.environ.get("APPDATA") or os.path.join(os.path.expanduser("~"), ".cache"),
+    "KPTools",
+    "ExpansionAirdropLootBuilder"
+)
+
+# Parsed types.xml results, reused while the xml's mtime + size are unchanged
+TYPES_CACHE_DIR = os.path.join(CACHE_ROOT, "types_cache")
+TYPES_CACHE_MAX_ENTRIES = 64
+
+# Info-tab logo resized once to 180x180, refreshed when kp_logo.png changes
+LOGO_CACHE_PATH = os.path.join(CACHE_ROOT, "logo_180.png")
+
 
 # ---------------- Types XML helpers ----------------
 
+XML_CHUNK_SIZE = 131072
+
 @dataclass
 class TypeItem:
     name: str
@@ -58,50 +109,513 @@ class TypeItem:
 
 
 def find_xml_files_in_folder(folder: str):
+    """
+    Recursive *.xml listing, parent folder files before subfolders (like
+    os.walk). scandir reuses the directory entry type, so no stat per file.
+    """
     out = []
-    for root, _dirs, files in os.walk(folder):
-        for f in files:
-            if f.lower().endswith(".xml"):
-                out.append(os.path.join(root, f))
+    stack = [folder]
+    while stack:
+        d = stack.pop()
+        files = []
+        subdirs = []
+        try:
+            with os.scandir(d) as it:
+                for e in it:
+                    if e.is_dir(follow_symlinks=False):
+                        subdirs.append(e.path)
+                    elif e.name[-4:].lower() == ".xml" and e.is_file():
+                        files.append(e.path)
+        except OSError:
+            continue
+        out.extend(sorted(files, key=str.lower))
+        # Reversed so the stack pops subfolders in name order
+        stack.extend(sorted(subdirs, key=str.lower, reverse=True))
     return out
 
 
-def load_types_xml(path: str):
+def iter_type_elements(path: str):
     """
-    Returns (items_list, meta_dict) where:
-      items_list: [classname,...]
-      meta_dict[classname] = {"source": <types file basename>, "category": ...}
+    Streams the <type> elements of a types.xml and frees each one once the
+    caller is done with it, so no full DOM is ever built.
     """
-    tree = ET.parse(path)
-    root = tree.getroot()
+    if LET is not None:
+        for _evt, t in LET.iterparse(path, events=("end",), tag="type"):
+            yield t
+            t.clear()
+            while t.getprevious() is not None:
+                del t.getparent()[0]
+        return
+
+    # Stdlib fallback: feed the C expat parser 128 KB chunks ourselves
+    # (ET.iterparse reads 16 KB at a time). The first "start" event is the
+    # root; its finished children are dropped after every chunk so the
+    # cleared <type> shells don't pile up under it.
+    parser = ET.XMLPullParser(("start", "end"))
+    root = None
+    with open(path, "rb") as f:
+        while True:
+            buf = f.read(XML_CHUNK_SIZE)
+            if not buf:
+                break
+            parser.feed(buf)
+            for evt, t in parser.read_events():
+                if evt == "start":
+                    if root is None:
+                        root = t
+                elif t.tag == "type":
+                    yield t
+                    t.clear()
+            if root is not None:
+                del root[:]
+    # close() raises on a truncated file, like ET.parse would
+    parser.close()
 
+
+def load_types_xml(path: str):
+    """
+    Returns (names, sources, categories): three parallel lists with one
+    entry per <type> in file order. sources[i] is the types file basename.
+    """
     items = []
-    meta = {}
-    src = os.path.basename(path)
+    cats = []
+    # Interned so the thousands of repeats share one string object each
+    src = sys.intern(os.path.basename(path))
 
-    for t in root.findall("type"):
+    for t in iter_type_elements(path):
         name = t.get("name")
         if not name:
             continue
+        name = sys.intern(name)
 
         cat = ""
         cat_node = t.find("category")
         if cat_node is not None and cat_node.text:
-            cat = cat_node.text.strip()
+            cat = sys.intern(cat_node.text.strip())
 
         items.append(name)
-        meta[name] = {"source": src, "category": cat}
+        cats.append(cat)
+
+    return items, [src] * len(items), cats
+
+
+def types_cache_path(xml_path: str) -> str:
+    key = hashlib.blake2b(
+        os.path.normcase(os.path.abspath(xml_path)).encode("utf-8"), digest_size=8
+    ).hexdigest()
+    return os.path.join(TYPES_CACHE_DIR, key + ".pkl")
+
+
+def read_types_cache(path: str):
+    """Cached load_types_xml() result for path, or None if missing or stale."""
+    try:
+        st = os.stat(path)
+        with open(types_cache_path(path), "rb") as f:
+            cached_stamp, result = pickle.load(f)
+    except Exception:
+        return None
+    if cached_stamp != (st.st_mtime_ns, st.st_size):
+        return None
+    # Mark the entry as recently used for prune_types_cache()
+    try:
+        os.utime(types_cache_path(path))
+    except OSError:
+        pass
+    return result
+
 
-    return items, meta
+def prune_types_cache(max_entries: int = TYPES_CACHE_MAX_ENTRIES):
+    """
+    Keeps the max_entries most recently used cache entries and deletes the
+    rest, plus .tmp files left by an interrupted write. Best effort.
+    """
+    entries = []
+    try:
+        with os.scandir(TYPES_CACHE_DIR) as it:
+            for entry in it:
+                try:
+                    if entry.name.endswith(".tmp"):
+                        os.remove(entry.path)
+                    elif entry.name.endswith(".pkl"):
+                        entries.append((entry.stat().st_mtime_ns, entry.path))
+                except OSError:
+                    pass
+    except OSError:
+        return
+
+    entries.sort(reverse=True)
+    for _mtime, path in entries[max_entries:]:
+        try:
+            os.remove(path)
+        except OSError:
+            pass
+
+
+def load_types_xml_cached(path: str, use_cache: bool = True):
+    """
+    load_types_xml() backed by an on-disk cache keyed by (mtime_ns, size).
+    use_cache=False forces a re-parse and refreshes the cache entry.
+    """
+    if use_cache:
+        result = read_types_cache(path)
+        if result is not None:
+            return result
+
+    st = os.stat(path)
+    stamp = (st.st_mtime_ns, st.st_size)
+    cache = types_cache_path(path)
+    result = load_types_xml(path)
+
+    # Best effort: a missing cache only means the next start parses again
+    try:
+        os.makedirs(TYPES_CACHE_DIR, exist_ok=True)
+        tmp = cache + ".tmp"
+        with open(tmp, "wb") as f:
+            pickle.dump((stamp, result), f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp, cache)
+    except Exception:
+        pass
+
+    return result
+
+
+# ---------------- JSON helpers ----------------
+
+def read_json_file(path: str):
+    # One binary read; both parsers accept the raw bytes (no text decode pass)
+    with open(path, "rb") as f:
+        raw = f.read()
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+
+def write_json_file(path: str, data):
+    # Serialize first, then hand the file a single write (indent=2 either way)
+    if orjson is not None:
+        buf = orjson.dumps(data, option=orjson.OPT_INDENT_2)
+    else:
+        buf = json.dumps(data, indent=2).encode("utf-8")
+    # Write a sibling temp file and swap it in, so a crash mid-save can never
+    # leave a truncated config / airdrop / market file behind
+    tmp = path + ".tmp"
+    with open(tmp, "wb") as f:
+        f.write(buf)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp, path)
+
+
+def copy_json_tree(data):
+    # Deep copy that only rebuilds dicts/lists; str/int/float/bool/None are
+    # immutable and shared. Cheaper than copy.deepcopy (no memo/reduce) and
+    # than a json round-trip (no string in between).
+    if type(data) is dict:
+        data = dict(data)
+        for k, v in data.items():
+            if type(v) is dict or type(v) is list:
+                data[k] = copy_json_tree(v)
+        return data
+    if type(data) is list:
+        return [copy_json_tree(v) if type(v) is dict or type(v) is list else v for v in data]
+    return data
+
+
+def drop_non_dict_rows(rows):
+    # Loot / market rows that aren't objects can't be shown or edited; dropping
+    # them once at load lets the table loops skip a type check per row
+    if isinstance(rows, list) and not all(type(r) is dict for r in rows):
+        rows[:] = [r for r in rows if isinstance(r, dict)]
+
+
+# Optional market item fields Expansion writes on every row
+MARKET_ROW_DEFAULTS = {"SellPricePercent": -1, "QuantityPercent": -1, "SpawnAttachments": [], "Variants": []}
+
+
+def fill_market_defaults(rows):
+    # Filled in once at load so the market editors never patch rows;
+    # list defaults are copied per row
+    for row in rows:
+        for k, v in MARKET_ROW_DEFAULTS.items():
+            if k not in row:
+                row[k] = list(v) if type(v) is list else v
+
+
+# Fields the tool reads and writes; older / hand-made files may spell them
+# with the m_ member prefix. They're renamed once at load (and back on save)
+# so the editor only ever looks up the bare names.
+CONTAINER_FIELDS = ("Name", "Container", "ItemCount", "Infected", "InfectedCount", "Loot")
+LOOT_FIELDS = ("Name", "Chance", "Min", "Max", "QuantityPercent")
+
+
+def rename_keys(row: dict, renames: dict):
+    # In-place key rename that keeps the dict's key order (and so the saved
+    # file's field order). Keys whose new name is already present stay as-is.
+    # Returns the new names of the keys that were renamed.
+    hits = {k: v for k, v in renames.items() if k in row and v not in row}
+    if hits:
+        items = [(hits.get(k, k), v) for k, v in row.items()]
+        row.clear()
+        row.update(items)
+    return tuple(hits.values())
 
 
 def safe_int(val, default=0):
+    # Plain digit strings (the usual editor field) skip the try/except setup
+    if type(val) is str and val.isdecimal():
+        return int(val)
     try:
         return int(val)
     except Exception:
         return default
 
 
+def load_logo_image(path: str):
+    """kp_logo.png at 180x180, read from LOGO_CACHE_PATH when it is up to date."""
+    try:
+        if os.path.getmtime(LOGO_CACHE_PATH) >= os.path.getmtime(path):
+            return Image.open(LOGO_CACHE_PATH)
+    except Exception:
+        pass
+
+    img = Image.open(path).resize((180, 180))
+    # Best effort: without the cache the next start just resizes again
+    try:
+        os.makedirs(os.path.dirname(LOGO_CACHE_PATH), exist_ok=True)
+        tmp = LOGO_CACHE_PATH + ".tmp"
+        img.save(tmp, format="PNG")
+        os.replace(tmp, LOGO_CACHE_PATH)
+    except Exception:
+        pass
+    return img
+
+
+# ---------------- Virtual Treeview ----------------
+
+class VirtualTree:
+    """
+    Shows a long Python list in a ttk.Treeview by only creating items for the
+    rows that fit on screen. Those items are a fixed pool of slots that get
+    their values rewritten in place; the scrollbar, mouse wheel and arrow keys
+    move the window instead of scrolling Tk's own items, so refreshing a
+    50k-row list costs the same as refreshing 30 rows.
+    """
+
+    def __init__(self, tree, scrollbar, values):
+        self.tree = tree
+        self.scrollbar = scrollbar
+        self.values = values  # row -> tuple of column values
+        self.rows = []
+        self.top = 0
+        self.visible = 20
+        # Item iids in display order: slot k shows row top + k. Only the first
+        # `attached` are in the tree; the rest are detached spares.
+        self.slots = []
+        self.attached = 0
+        # Row position of the selection; kept while it is scrolled out of view.
+        # With selectmode="extended", selection holds every selected row
+        # position, selected is the last one clicked and anchor is where a
+        # Shift-click range starts (Tk's own anchor is a slot, i.e. whatever
+        # row that slot shows after a scroll, so clicks are handled here).
+        self.selected = None
+        self.selection = set()
+        self.anchor = None
+        self.multi = str(tree.cget("selectmode")) == "extended"
+
+        scrollbar.configure(command=self.yview)
+        tree.bind("<Configure>", self._on_configure)
+        tree.bind("<MouseWheel>", lambda e: self.scroll_by(-3 if e.delta > 0 else 3))
+        tree.bind("<Button-4>", lambda _e: self.scroll_by(-3))
+        tree.bind("<Button-5>", lambda _e: self.scroll_by(3))
+        tree.bind("<Up>", lambda _e: self.step_selection(-1))
+        tree.bind("<Down>", lambda _e: self.step_selection(1))
+        tree.bind("<Prior>", lambda _e: self.step_selection(-self.visible))
+        tree.bind("<Next>", lambda _e: self.step_selection(self.visible))
+        tree.bind("<<TreeviewSelect>>", self._on_select, add="+")
+        if self.multi:
+            tree.bind("<Button-1>", self._on_click)
+
+    def set_rows(self, rows):
+        self.rows = rows
+        self.top = 0
+        self.selected = None
+        self.selection = set()
+        self.anchor = None
+        self.render()
+
+    def selected_row(self):
+        if self.selected is None or self.selected >= len(self.rows):
+            return None
+        return self.rows[self.selected]
+
+    def selected_rows(self):
+        # All selected rows, in display order
+        rows = self.rows
+        return [rows[i] for i in sorted(self.selection) if i < len(rows)]
+
+    def _clamp(self, top):
+        return max(0, min(top, len(self.rows) - self.visible))
+
+    def _fill(self, first, last):
+        # Rewrite slots first..last-1 with the rows they now show. Raw Tcl
+        # calls skip ttk's per-call option formatting.
+        call = self.tree.tk.call
+        w = self.tree._w
+        slots = self.slots
+        rows = self.rows
+        values = self.values
+        zebra = ZEBRA_TAGS
+        top = self.top
+        for k in range(first, last):
+            row = top + k
+            call(w, "item", slots[k], "-values", values(rows[row]), "-tags", zebra[row & 1])
+
+    def render(self, shift=0):
+        tree = self.tree
+        slots = self.slots
+        n = len(self.rows)
+        top = self.top
+        count = max(0, min(self.visible, n - top))
+
+        if shift and abs(shift) < count == self.attached:
+            # Small scroll: rotate the slots that fell off one edge round to
+            # the other and rewrite only those
+            if shift > 0:
+                moved = slots[:shift]
+                slots[:count] = slots[shift:count] + moved
+                for s in moved:
+                    tree.move(s, "", "end")
+                self._fill(count - shift, count)
+            else:
+                moved = slots[count + shift:count]
+                slots[:count] = moved + slots[:count + shift]
+                for i, s in enumerate(moved):
+                    tree.move(s, "", i)
+                self._fill(0, -shift)
+        else:
+            if count > self.attached:
+                for k in range(self.attached, count):
+                    if k < len(slots):
+                        tree.reattach(slots[k], "", k)
+                    else:
+                        slots.append(tree.insert("", "end"))
+            elif count < self.attached:
+                tree.detach(*slots[count:self.attached])
+            self.attached = count
+            self._fill(0, count)
+
+        shown = [slots[i - top] for i in self.selection if top <= i < top + count]
+        if shown:
+            tree.selection_set(shown)
+        else:
+            # The slot that showed the selection may now hold another row
+            current = tree.selection()
+            if current:
+                tree.selection_remove(*current)
+
+        if n:
+            self.scrollbar.set(top / n, (top + count) / n)
+        else:
+            self.scrollbar.set(0.0, 1.0)
+
+    def scroll_to(self, top):
+        top = self._clamp(top)
+        if top != self.top:
+            shift = top - self.top
+            self.top = top
+            self.render(shift)
+        return "break"
+
+    def scroll_by(self, rows):
+        return self.scroll_to(self.top + rows)
+
+    def yview(self, *args):
+        # Scrollbar protocol: ("moveto", fraction) or ("scroll", n, "units"/"pages")
+        if not args:
+            return
+        if args[0] == "moveto":
+            self.scroll_to(int(float(args[1]) * len(self.rows)))
+        elif args[0] == "scroll":
+            step = self.visible if args[2].startswith("page") else 1
+            self.scroll_by(int(args[1]) * step)
+
+    def _on_configure(self, evt):
+        # Count whole rows below the heading (assumed about one row tall)
+        visible = max(1, (evt.height - TV_ROW_HEIGHT) // TV_ROW_HEIGHT)
+        if visible != self.visible:
+            self.visible = visible
+            self.top = self._clamp(self.top)
+            self.render()
+
+    def select(self, idx):
+        # Scroll idx into the window, then make it the selected row
+        if idx < self.top:
+            self.top = idx
+        elif idx >= self.top + self.visible:
+            self.top = idx - self.visible + 1
+        self.top = self._clamp(self.top)
+        self.selected = idx
+        self.selection = {idx}
+        self.anchor = idx
+        self.render()
+        self.tree.focus(self.slots[idx - self.top])
+
+    def step_selection(self, delta):
+        n = len(self.rows)
+        if n:
+            idx = self.top if self.selected is None else self.selected + delta
+            self.select(min(max(idx, 0), n - 1))
+        return "break"
+
+    def _on_click(self, evt):
+        # Extended-mode clicks on a row, by row position: plain click selects
+        # just that row, Ctrl toggles it, Shift selects anchor..row. Clicks
+        # outside the rows (headings, separators) go on to Tk.
+        iid = self.tree.identify_row(evt.y)
+        try:
+            k = self.slots.index(iid)
+        except ValueError:
+            return None
+        if k >= self.attached:
+            return None
+        row = self.top + k
+        if evt.state & 0x0001 and self.anchor is not None:
+            lo, hi = sorted((self.anchor, row))
+            self.selection = set(range(lo, hi + 1))
+        elif evt.state & 0x0004:
+            self.selection ^= {row}
+            self.anchor = row
+        else:
+            self.selection = {row}
+            self.anchor = row
+        if row in self.selection:
+            self.selected = row
+        elif self.selected not in self.selection:
+            self.selected = min(self.selection) if self.selection else None
+        self.tree.focus_set()
+        self.render()
+        self.tree.focus(iid)
+        # The class binding would redo the selection from Tk's slot anchor
+        return "break"
+
+    def _on_select(self, _evt=None):
+        sel = set(self.tree.selection())
+        top = self.top
+        end = top + self.attached
+        in_view = {top + k for k, s in enumerate(self.slots[:self.attached]) if s in sel}
+        if not self.multi:
+            # Rows scrolling out of view drop Tk's selection; keep ours
+            if in_view:
+                self.selection = in_view
+                self.selected = min(in_view)
+            return
+        # Tk only knows the rows on screen: take those from its selection and
+        # keep whatever was selected out of view
+        self.selection = {i for i in self.selection if not top <= i < end} | in_view
+        if self.selected not in self.selection:
+            self.selected = min(self.selection) if self.selection else None
+
+
 # ---------------- Main App ----------------
 
 class ExpansionAirdropLootBuilder(ctk.CTk):
@@ -146,17 +660,53 @@ class ExpansionAirdropLootBuilder(ctk.CTk):
 
         # Market State
         self.market_path = ""
+        # None or a dict (_load_market_path rejects anything else)
         self.market_data = None
         self.market_dirty = False
+        # Bumped on every change to market_data; refresh_market_tree skips
+        # the rebuild when it already shows this version
+        self._market_version = 0
+        self._market_tree_version = None
+        # Lowercased ClassName of each market_data["Items"] row (parallel list,
+        # so the JSON rows stay untouched) and lowercased name -> first index
+        self._market_lc = []
+        self._market_index = {}
 
         self.types_folders = []
         self.types_files_loaded = []
+        # Bumped by clear_types so parses still in flight are discarded
+        self._types_gen = 0
+        # Types parsing: one worker pool and result queue shared by every
+        # _merge_types_files call, plus the batches (one per call) still
+        # waiting to be applied, oldest first
+        self._types_pool = None
+        self._types_done = queue.Queue()
+        self._types_batches = deque()
+        self._types_drain_job = None
+        # Types database, stored as parallel columns rather than a dict per
+        # classname: all_items[i] is sorted case-insensitively and
+        # item_sources[i] / item_categories[i] / item_names_lc[i] belong to it
         self.all_items = []
-        self.item_meta = {}
-        self.source_to_items = {}
+        self.item_sources = []
+        self.item_categories = []
+        self.item_names_lc = []
+        self._names_blob = ""
+        self._name_starts = array("I")
+        self.item_index = {}
+        # Per types file rows, flattened: the rows of file src (sorted) are
+        # source_row_list[lo:hi] with (lo, hi) = source_ranges[src]
+        self.source_row_list = array("I")
+        self.source_ranges = {}
 
         self.container_names = []
         self.container_index = {}
+        self.container_list = None
+        # airdrop_data key container_list was found under
+        self._containers_key = None
+        # Container / loot dicts that came in with m_Name / m_Loot / ... keys:
+        # id(dict) -> (dict, bare names renamed at load). Only those keys on
+        # those dicts get their prefix back on save.
+        self._prefixed_keys = {}
 
         self.current_container_key = None
 
@@ -165,12 +715,29 @@ class ExpansionAirdropLootBuilder(ctk.CTk):
 
         self.selected_loot_index = None
 
+        # Text last set on each status label (see _set_label_text)
+        self._label_texts = {}
+
         # Throttle jobs
         self._item_job = None
         self._loot_job = None
+        # (next loot index, rows inserted) while the loot table fills in chunks
+        self._loot_fill = None
+        self._market_types_job = None
+        # Pending after_idle market table refresh (edits in one turn share it)
+        self._market_refresh_job = None
+        # Last query each browser was built for; None forces the next rebuild
+        self._last_item_query = None
+        self._last_market_query = None
+
+        # Paths with a background save in flight, and the save (data, done)
+        # clicked for each while it ran; only the latest one is kept
+        self._saves_running = set()
+        self._saves_queued = {}
 
         # Search state
         self.var_search = ctk.StringVar(value="")
+        self.var_search_mode = ctk.StringVar(value="Contains")
         self.var_source = ctk.StringVar(value="All Types Files")
 
         # dropdown for containers
@@ -201,8 +768,7 @@ class ExpansionAirdropLootBuilder(ctk.CTk):
     def _load_config(self):
         try:
             if os.path.exists(self.config_path):
-                with open(self.config_path, "r", encoding="utf-8") as f:
-                    data = json.load(f)
+                data = read_json_file(self.config_path)
                 if isinstance(data, dict):
                     self.cfg.update(data)
         except Exception:
@@ -211,8 +777,7 @@ class ExpansionAirdropLootBuilder(ctk.CTk):
     def _save_config(self):
         try:
             os.makedirs(self.config_dir, exist_ok=True)
-            with open(self.config_path, "w", encoding="utf-8") as f:
-                json.dump(self.cfg, f, indent=2)
+            write_json_file(self.config_path, self.cfg)
         except Exception:
             pass
 
@@ -330,12 +895,26 @@ class ExpansionAirdropLootBuilder(ctk.CTk):
         ent.grid(row=0, column=0, sticky="ew")
         ent.bind("<KeyRelease>", lambda _e: self.refresh_item_filter())
 
+        ctk.CTkOptionMenu(
+            search_row,
+            values=["Contains", "Starts with"],
+            variable=self.var_search_mode,
+            width=110,
+            fg_color=KP_PANEL_2,
+            button_color=KP_GREEN_DARK,
+            button_hover_color=KP_GREEN,
+            text_color=KP_TEXT,
+            dropdown_fg_color=KP_PANEL,
+            dropdown_text_color=KP_TEXT,
+            command=lambda _: self.refresh_item_filter()
+        ).grid(row=0, column=1, padx=(8, 0))
+
         ctk.CTkButton(
             search_row, text="Clear",
             fg_color=KP_PANEL_2, hover_color="#16251a",
             text_color=KP_TEXT,
             command=self.clear_search
-        ).grid(row=0, column=1, padx=(8, 0))
+        ).grid(row=0, column=2, padx=(8, 0))
 
         ctk.CTkButton(
             left, text="Add Selected → Loot",
@@ -361,9 +940,9 @@ class ExpansionAirdropLootBuilder(ctk.CTk):
         self.item_tree.column("Source", width=160, anchor="w")
         self.item_tree.grid(row=0, column=0, sticky="nsew")
 
-        item_scroll = ttk.Scrollbar(item_host, orient="vertical", command=self.item_tree.yview)
+        item_scroll = ttk.Scrollbar(item_host, orient="vertical")
         item_scroll.grid(row=0, column=1, sticky="ns")
-        self.item_tree.configure(yscrollcommand=item_scroll.set)
+        self.item_view = VirtualTree(self.item_tree, item_scroll, self._item_row_values)
 
         # Right panel (airdrop containers + loot editor)
         right = ctk.CTkFrame(body, fg_color=KP_PANEL, corner_radius=12)
@@ -553,7 +1132,7 @@ class ExpansionAirdropLootBuilder(ctk.CTk):
             placeholder_text_color=KP_MUTED
         )
         m_ent.grid(row=0, column=0, sticky="ew")
-        m_ent.bind("<KeyRelease>", lambda _e: self._refresh_market_types_list())
+        m_ent.bind("<KeyRelease>", lambda _e: self.refresh_market_types_filter())
 
         ctk.CTkButton(
             m_search_row, text="Clear",
@@ -572,7 +1151,7 @@ class ExpansionAirdropLootBuilder(ctk.CTk):
             m_types_host,
             columns=("Name", "Source"),
             show="headings",
-            selectmode="browse"
+            selectmode="extended"
         )
         self.mkt_types_tree.heading("Name", text="Classname")
         self.mkt_types_tree.heading("Source", text="Types File")
@@ -580,9 +1159,9 @@ class ExpansionAirdropLootBuilder(ctk.CTk):
         self.mkt_types_tree.column("Source", width=160, anchor="w")
         self.mkt_types_tree.grid(row=0, column=0, sticky="nsew")
 
-        m_types_scroll = ttk.Scrollbar(m_types_host, orient="vertical", command=self.mkt_types_tree.yview)
+        m_types_scroll = ttk.Scrollbar(m_types_host, orient="vertical")
         m_types_scroll.grid(row=0, column=1, sticky="ns")
-        self.mkt_types_tree.configure(yscrollcommand=m_types_scroll.set)
+        self.mkt_types_view = VirtualTree(self.mkt_types_tree, m_types_scroll, self._item_row_values)
 
         # Double click to add to market
         self.mkt_types_tree.bind("<Double-1>", lambda _e: self.market_add_selected_from_types())
@@ -637,7 +1216,7 @@ class ExpansionAirdropLootBuilder(ctk.CTk):
             table_host,
             columns=("ClassName", "MinPrice", "MaxPrice", "MinStock", "MaxStock"),
             show="headings",
-            selectmode="browse"
+            selectmode="extended"
         )
         for col, w in [("ClassName", 260), ("MinPrice", 90), ("MaxPrice", 90), ("MinStock", 90), ("MaxStock", 90)]:
             self.market_tree.heading(col, text=col)
@@ -715,8 +1294,7 @@ class ExpansionAirdropLootBuilder(ctk.CTk):
             try:
                 logo_path = os.path.join(os.path.abspath(os.path.dirname(__file__)), "kp_logo.png")
                 if os.path.exists(logo_path):
-                    img = Image.open(logo_path)
-                    img = img.resize((180, 180))
+                    img = load_logo_image(logo_path)
                     self.logo_ctk = ctk.CTkImage(light_image=img, dark_image=img, size=(180, 180))
                     ctk.CTkLabel(logo_row, image=self.logo_ctk, text="").pack(side="left", padx=(0, 12))
             except Exception:
@@ -780,7 +1358,7 @@ class ExpansionAirdropLootBuilder(ctk.CTk):
                         background=TV_BG,
                         fieldbackground=TV_BG,
                         foreground=KP_TEXT,
-                        rowheight=22,
+                        rowheight=TV_ROW_HEIGHT,
                         borderwidth=0)
         style.map("Treeview",
                   background=[("selected", TV_SEL)],
@@ -793,7 +1371,10 @@ class ExpansionAirdropLootBuilder(ctk.CTk):
         style.map("Treeview.Heading",
                   background=[("active", TV_HEAD_BG)])
 
-        # tag colors
+        # tag colors: configured once per tree, rows only carry the tag name
+        for tree in (self.item_tree, self.loot_tree, self.mkt_types_tree, self.market_tree):
+            tree.tag_configure("even", background=TV_ROW_EVEN)
+            tree.tag_configure("odd", background=TV_ROW_ODD)
         self._tv_tags_ready = True
 
     # ---------------- Helpers ----------------
@@ -814,12 +1395,35 @@ class ExpansionAirdropLootBuilder(ctk.CTk):
                 pass
             self._loot_job = None
 
+    def _cancel_market_types_job(self):
+        if self._market_types_job is not None:
+            try:
+                self.after_cancel(self._market_types_job)
+            except Exception:
+                pass
+            self._market_types_job = None
+
+    def _cancel_market_refresh_job(self):
+        if self._market_refresh_job is not None:
+            try:
+                self.after_cancel(self._market_refresh_job)
+            except Exception:
+                pass
+            self._market_refresh_job = None
+
+    def _set_label_text(self, label, text: str):
+        # Every configure is a Tcl round-trip + redraw; skip it when nothing changed
+        if self._label_texts.get(label) != text:
+            self._label_texts[label] = text
+            label.configure(text=text)
+
     def _update_paths_label(self):
         ap = os.path.basename(self.airdrop_path) if self.airdrop_path else "None"
         tf = f"{len(self.types_files_loaded)} file(s)" if self.types_files_loaded else "None"
         mk = os.path.basename(self.market_path) if getattr(self, "market_path", "") else "None"
-        self.lbl_paths.configure(
-            text=f"Airdrop: {ap} | Types: {tf} | Market: {mk} | Config: %APPDATA%\\KPTools\\ExpansionAirdropLootBuilder"
+        self._set_label_text(
+            self.lbl_paths,
+            f"Airdrop: {ap} | Types: {tf} | Market: {mk} | Config: %APPDATA%\\KPTools\\ExpansionAirdropLootBuilder"
         )
         self._update_market_path_label()
 
@@ -831,10 +1435,11 @@ class ExpansionAirdropLootBuilder(ctk.CTk):
         )
         if not folder:
             return
-        # allow picking multiple times; merges into the same database
-        self._load_types_folder_silent(folder)
+        # allow picking multiple times; merges into the same database.
+        # An explicit pick always re-parses so the types cache is refreshed.
+        self._load_types_folder_silent(folder, use_cache=False)
 
-    def _load_types_folder_silent(self, folder: str, show_warnings: bool = False):
+    def _load_types_folder_silent(self, folder: str, show_warnings: bool = False, use_cache: bool = True):
         if folder in self.types_folders:
             return
 
@@ -845,17 +1450,27 @@ class ExpansionAirdropLootBuilder(ctk.CTk):
             return
 
         self.types_folders.append(folder)
-        self._merge_types_files(xmls, show_warnings=show_warnings)
+        self._merge_types_files(xmls, show_warnings=show_warnings, use_cache=use_cache)
         self._remember_types_folders(self.types_folders)
         self._update_paths_label()
 
     def clear_types(self):
         self._cancel_item_job()
+        # Parses still running belong to the old set; their results are dropped
+        self._types_gen += 1
+        self._types_batches.clear()
         self.types_folders = []
         self.types_files_loaded = []
         self.all_items = []
-        self.item_meta.clear()
-        self.source_to_items.clear()
+        self.item_sources = []
+        self.item_categories = []
+        self.item_names_lc = []
+        self._names_blob = ""
+        self._name_starts = array("I")
+        self.item_index = {}
+        self.source_row_list = array("I")
+        self.source_ranges = {}
+        self._last_item_query = self._last_market_query = None
 
         self.dd_source.configure(values=["All Types Files"])
         self.var_source.set("All Types Files")
@@ -864,96 +1479,230 @@ class ExpansionAirdropLootBuilder(ctk.CTk):
         self._update_paths_label()
         self._refresh_market_types_list()
 
-    def _merge_types_files(self, paths, show_warnings: bool = True):
-        merged_items = set(self.all_items)
+    def _merge_types_files(self, paths, show_warnings: bool = True, use_cache: bool = True):
+        # Cache hits are cheap; only files that really need parsing go out
+        results = {}
         errors = []
-
+        todo = []
         for p in paths:
-            try:
-                items, meta = load_types_xml(p)
-                src = os.path.basename(p)
-
-                self.source_to_items[src] = items
-                if p not in self.types_files_loaded:
-                    self.types_files_loaded.append(p)
+            cached = read_types_cache(p) if use_cache else None
+            if cached is None:
+                todo.append(p)
+            else:
+                results[p] = cached
 
-                for k, v in meta.items():
-                    if k not in self.item_meta:
-                        self.item_meta[k] = v
+        if not todo and not self._types_batches:
+            self._apply_types_files(paths, results, errors, show_warnings)
+            return
 
-                for it in items:
-                    merged_items.add(it)
+        # Batches are applied strictly in the order they were started (e.g.
+        # the saved folders at startup), so which file "wins" a duplicated
+        # classname never depends on which parse happened to finish first
+        batch = {"gen": self._types_gen, "paths": paths, "results": results, "errors": errors,
+                 "left": len(todo), "show_warnings": show_warnings}
+        self._types_batches.append(batch)
+
+        # Parsing is CPU-bound and independent per file, so it runs in worker
+        # processes (threads would just take turns on the GIL with Tk). Each
+        # finished file lands on the queue from a pool thread; the Tk loop
+        # drains it, so results are only ever touched on this thread.
+        if todo:
+            if self._types_pool is None:
+                self._types_pool = ProcessPoolExecutor(max_workers=os.cpu_count() or 1)
+            done = self._types_done
+            for p in todo:
+                fut = self._types_pool.submit(load_types_xml_cached, p, False)
+                fut.add_done_callback(lambda f, b=batch, p=p: done.put((b, p, f)))
+
+        if self._types_drain_job is None:
+            self._drain_types_queue()
+
+    def _drain_types_queue(self):
+        self._types_drain_job = None
+        while True:
+            try:
+                batch, p, fut = self._types_done.get_nowait()
+            except queue.Empty:
+                break
+            if batch["gen"] != self._types_gen:
+                # clear_types ran meanwhile; drop this result
+                continue
+            batch["left"] -= 1
+            try:
+                batch["results"][p] = fut.result()
             except Exception as e:
-                errors.append(f"{os.path.basename(p)}: {e}")
-
-        self.all_items = sorted(merged_items, key=str.lower)
+                batch["errors"].append(f"{os.path.basename(p)}: {e}")
+
+        batches = self._types_batches
+        while batches and batches[0]["left"] == 0:
+            b = batches.popleft()
+            self._apply_types_files(b["paths"], b["results"], b["errors"], b["show_warnings"])
+
+        if batches:
+            left = sum(b["left"] for b in batches)
+            self._set_label_text(self.lbl_paths, f"Parsing types files... ({left} left)")
+            self._types_drain_job = self.after(50, self._drain_types_queue)
+        elif self._types_pool is not None:
+            # Idle: let the worker processes exit until the next load
+            self._types_pool.shutdown(wait=False)
+            self._types_pool = None
+
+    def _apply_types_files(self, paths, results, errors, show_warnings):
+        # classname -> (source, category); the first file that defines a
+        # classname wins, same as before
+        merged = dict(zip(self.all_items, zip(self.item_sources, self.item_categories)))
+        # types file basename -> its classnames, rebuilt from the current rows
+        old_names = self.all_items
+        old_rows = self.source_row_list
+        source_names = {
+            src: [old_names[i] for i in old_rows[lo:hi]]
+            for src, (lo, hi) in self.source_ranges.items()
+        }
 
-        sources = ["All Types Files"] + sorted(self.source_to_items.keys(), key=str.lower)
+        # Merge in the original path order so the first file still wins
+        for p in paths:
+            if p not in results:
+                continue
+            items, srcs, cats = results[p]
+            src = os.path.basename(p)
+
+            source_names[src] = items
+            if p not in self.types_files_loaded:
+                self.types_files_loaded.append(p)
+
+            for name, info in zip(items, zip(srcs, cats)):
+                if name not in merged:
+                    merged[name] = info
+
+        # merged lists the existing (sorted) names first, so only the new ones
+        # need lowering and sorting; if there are none the columns stand
+        new_names = list(islice(merged, len(old_names), None))
+        if new_names:
+            new_names.sort(key=str.lower)
+            # Timsort sees two sorted runs and merges them in one pass; it is
+            # stable, so equal-lowercase names keep their old relative order
+            pairs = sorted(
+                zip(self.item_names_lc + [name.lower() for name in new_names], old_names + new_names),
+                key=itemgetter(0),
+            )
+            # Lowercased once here so searching never calls .lower() per keystroke
+            self.item_names_lc = [lc for lc, _name in pairs]
+            self.all_items = [name for _lc, name in pairs]
+            self.item_index = {name: i for i, name in enumerate(self.all_items)}
+            self.item_sources = [merged[name][0] for name in self.all_items]
+            self.item_categories = [merged[name][1] for name in self.all_items]
+            # All lowered names in one newline-separated string, plus where each
+            # starts, so "Contains" can run str.find (C) instead of a Python loop
+            self._names_blob = "\n".join(self.item_names_lc)
+            starts = array("I")
+            pos = 0
+            for s in self.item_names_lc:
+                starts.append(pos)
+                pos += len(s) + 1
+            self._name_starts = starts
+        index = self.item_index
+        flat = array("I")
+        ranges = {}
+        for src, items in source_names.items():
+            lo = len(flat)
+            flat.extend(sorted({index[name] for name in items}))
+            ranges[src] = (lo, len(flat))
+        self.source_row_list = flat
+        self.source_ranges = ranges
+        sources = ["All Types Files"] + sorted(ranges, key=str.lower)
         self.dd_source.configure(values=sources)
         self.var_source.set("All Types Files")
-        self.refresh_item_filter()
+        # Row numbers just changed, so both views refresh now (not debounced)
+        self._last_item_query = self._last_market_query = None
+        self._item_insert_step()
         self._refresh_market_types_list()
+        self._update_paths_label()
+        if not self._types_batches:
+            prune_types_cache()
 
         if errors and show_warnings:
             messagebox.showwarning("Some files failed to load", "A few types files failed:\n\n" + "\n".join(errors))
 
     def clear_search(self):
         self.var_search.set("")
-        self.refresh_item_filter()
+        self._item_insert_step()
 
     def refresh_item_filter(self):
         self._cancel_item_job()
-        # debounce redraw
-        self._item_job = self.after(75, self._item_insert_step)
+        # debounce redraw (typing restarts the timer, so only the last key rebuilds)
+        self._item_job = self.after(SEARCH_DEBOUNCE_MS, self._item_insert_step)
 
     def _get_filtered_items(self):
+        """
+        Returns the row numbers (into all_items / item_sources) that match the
+        current source + search, in one pass over the pre-lowered names.
+        """
         q = (self.var_search.get() or "").strip().lower()
         src = self.var_source.get() or "All Types Files"
-
-        if not self.all_items:
-            return []
+        lc = self.item_names_lc
+        prefix = self.var_search_mode.get() == "Starts with"
 
         if src == "All Types Files":
-            base = self.all_items
+            base = range(len(lc))
         else:
-            base = self.source_to_items.get(src, [])
-
+            lo, hi = self.source_ranges.get(src, (0, 0))
+            # memoryview slice: a window onto the flat array, no copy
+            base = memoryview(self.source_row_list)[lo:hi]
         if not q:
             return base
-
-        out = []
-        for name in base:
-            if q in name.lower():
-                out.append(name)
-        return out
-
-    def _reset_tree_zebra(self, tree):
-        # re-tag all rows for zebra striping
-        for i, iid in enumerate(tree.get_children("")):
-            tree.item(iid, tags=("odd" if i % 2 else "even",))
+        if prefix:
+            # Rows are in item_names_lc order, so the names starting with q
+            # are one contiguous band: two binary searches, no scan
+            key = lc.__getitem__
+            lo = bisect_left(base, q, key=key)
+            hi = bisect_left(base, q + PREFIX_END, lo, key=key)
+            return base[lo:hi]
+        if q not in self._names_blob:
+            # No classname contains q anywhere; one C scan says so
+            return []
+        if src == "All Types Files":
+            return self._names_containing(q)
+        return [i for i in base if q in lc[i]]
+
+    def _names_containing(self, q: str):
+        """Rows whose lowered name contains q, in row order."""
+        lc = self.item_names_lc
+        if "\n" in q:
+            # Only possible from a paste; no classname spans lines
+            return []
+        if len(q) < 2:
+            # Matches nearly every name; the plain scan is cheaper per hit
+            return [i for i, s in enumerate(lc) if q in s]
+        # Each hit costs one find + one bisect, and misses cost nothing in
+        # Python, which wins once q is selective
+        starts = self._name_starts
+        find = self._names_blob.find
+        n = len(starts)
+        rows = []
+        pos = find(q)
+        while pos != -1:
+            i = bisect_right(starts, pos) - 1
+            rows.append(i)
+            # Resume at the next name so a row is only listed once
+            pos = find(q, starts[i + 1]) if i + 1 < n else -1
+        return rows
+
+    def _item_row_values(self, i):
+        return (self.all_items[i], self.item_sources[i])
 
     def _item_insert_step(self):
-        self._item_job = None
-
-        # clear
-        self.item_tree.delete(*self.item_tree.get_children())
-
-        items = self._get_filtered_items()
-        if not items:
+        self._cancel_item_job()
+        # Keys that don't change the text (arrows, shift...) also land here
+        key = (
+            (self.var_search.get() or "").strip().lower(),
+            self.var_source.get(),
+            self.var_search_mode.get(),
+        )
+        if key == self._last_item_query:
             return
-
-        # render limited rows for perf (search narrows it)
-        max_rows = 1200 if (self.var_search.get() or "").strip() else 600
-        count = 0
-        for name in items:
-            meta = self.item_meta.get(name, {})
-            src = meta.get("source", "")
-            self.item_tree.insert("", "end", values=(name, src))
-            count += 1
-            if count >= max_rows:
-                break
-
-        self._reset_tree_zebra(self.item_tree)
+        self._last_item_query = key
+        # Only the visible window becomes Treeview rows, so no row cap needed
+        self.item_view.set_rows(self._get_filtered_items())
 
     # ---------------- Airdrop file ----------------
 
@@ -968,13 +1717,16 @@ class ExpansionAirdropLootBuilder(ctk.CTk):
 
     def _load_airdrop_path(self, path: str, silent: bool = False):
         try:
-            with open(path, "r", encoding="utf-8") as f:
-                data = json.load(f)
+            data = read_json_file(path)
             self.airdrop_data = data
             self.airdrop_path = path
             self._remember_airdrop_path(path)
 
             self._index_containers()
+            self._prefixed_keys = self._normalize_containers(self.container_list or ())
+            if self._prefixed_keys:
+                # Labels were built from the m_ names; index again on the bare ones
+                self._index_containers()
             self._refresh_container_dropdown()
 
             self._update_paths_label()
@@ -984,6 +1736,66 @@ class ExpansionAirdropLootBuilder(ctk.CTk):
             if not silent:
                 messagebox.showerror("Load Error", str(e))
 
+    @staticmethod
+    def _normalize_containers(containers):
+        """
+        Renames m_-prefixed container / loot fields to their bare names and
+        drops loot rows that aren't objects. Returns the renamed dicts as
+        {id(dict): (dict, renamed bare keys)}.
+        """
+        c_renames = {"m_" + k: k for k in CONTAINER_FIELDS}
+        l_renames = {"m_" + k: k for k in LOOT_FIELDS}
+        prefixed = {}
+        for c in containers:
+            if not isinstance(c, dict):
+                continue
+            keys = rename_keys(c, c_renames)
+            if keys:
+                prefixed[id(c)] = (c, keys)
+            loot = c.get("Loot")
+            drop_non_dict_rows(loot)
+            if isinstance(loot, list):
+                for row in loot:
+                    keys = rename_keys(row, l_renames)
+                    if keys:
+                        prefixed[id(row)] = (row, keys)
+        return prefixed
+
+    def _prefixed_airdrop_copy(self):
+        # Inverse of _normalize_containers: a copy of the data where only the
+        # dicts that came in with m_ keys get those keys back. Rows added or
+        # cloned since, and rows that were bare in the file, stay bare; the
+        # live dicts keep the bare names the editor uses.
+        prefixed = self._prefixed_keys
+
+        def restore(d):
+            hit = prefixed.get(id(d))
+            # (identity check: a removed row's id can be reused by a new one)
+            if hit is None or hit[0] is not d:
+                return d
+            d = dict(d)
+            rename_keys(d, {k: "m_" + k for k in hit[1]})
+            return d
+
+        containers = []
+        for c in self.container_list:
+            if isinstance(c, dict):
+                loot = c.get("Loot")
+                new_loot = [restore(row) for row in loot] if isinstance(loot, list) else loot
+                loot_changed = new_loot is not loot and any(a is not b for a, b in zip(new_loot, loot))
+                hit = prefixed.get(id(c))
+                c_changed = hit is not None and hit[0] is c
+                if loot_changed or c_changed:
+                    c = dict(c)
+                    if loot_changed:
+                        c["Loot"] = new_loot
+                    if c_changed:
+                        rename_keys(c, {k: "m_" + k for k in hit[1]})
+            containers.append(c)
+        data = dict(self.airdrop_data)
+        data[self._containers_key] = containers
+        return data
+
     def save_airdrop(self):
         if not self.airdrop_data or not self.airdrop_path:
             messagebox.showwarning("No file", "Load an AirdropSettings.json first.")
@@ -991,24 +1803,69 @@ class ExpansionAirdropLootBuilder(ctk.CTk):
 
         # Apply pending container settings before save
         self._commit_container_settings_to_data()
+        data = self.airdrop_data
+        if self._prefixed_keys and self.container_list is not None and self._containers_key is not None:
+            data = self._prefixed_airdrop_copy()
 
-        # Backup
-        ts = time.strftime("%Y%m%d_%H%M%S")
-        bak = f"{self.airdrop_path}.bak_{ts}"
-        try:
-            shutil.copy2(self.airdrop_path, bak)
-        except Exception:
-            bak = None
-
-        try:
-            with open(self.airdrop_path, "w", encoding="utf-8") as f:
-                json.dump(self.airdrop_data, f, indent=2)
+        def done(bak, err):
+            if err is not None:
+                messagebox.showerror("Save Error", str(err))
+                return
             msg = "Saved successfully."
             if bak:
                 msg += f"\nBackup: {os.path.basename(bak)}"
             messagebox.showinfo("Saved", msg)
+
+        self._save_in_background(self.airdrop_path, data, done)
+
+    def _save_in_background(self, path, data, done):
+        """
+        Backup + serialize + write on a worker thread so big files don't freeze
+        the window. done(backup_path, error) runs back on the UI thread.
+        """
+        # The thread gets a private copy taken now, so the file holds exactly
+        # what was there at the click; later edits wait for the next save
+        data = copy_json_tree(data)
+        if path in self._saves_running:
+            # Written as soon as the running save to this path finishes
+            self._saves_queued[path] = (data, done)
+            return
+        self._start_save(path, data, done)
+
+    def _start_save(self, path, data, done):
+        results = queue.Queue()
+        self._saves_running.add(path)
+        threading.Thread(target=self._save_worker, args=(path, data, results), daemon=True).start()
+        self.after(50, self._poll_save, path, results, done)
+
+    @staticmethod
+    def _save_worker(path, data, results):
+        bak = None
+        if os.path.isfile(path):
+            ts = time.strftime("%Y%m%d_%H%M%S")
+            bak = f"{path}.bak_{ts}"
+            try:
+                shutil.copy2(path, bak)
+            except Exception:
+                bak = None
+        try:
+            write_json_file(path, data)
         except Exception as e:
-            messagebox.showerror("Save Error", str(e))
+            results.put((bak, e))
+            return
+        results.put((bak, None))
+
+    def _poll_save(self, path, results, done):
+        try:
+            bak, err = results.get_nowait()
+        except queue.Empty:
+            self.after(50, self._poll_save, path, results, done)
+            return
+        self._saves_running.discard(path)
+        queued = self._saves_queued.pop(path, None)
+        if queued is not None:
+            self._start_save(path, *queued)
+        done(bak, err)
 
     # ---------------- Containers / Loot ----------------
 
@@ -1022,41 +1879,67 @@ class ExpansionAirdropLootBuilder(ctk.CTk):
         self.container_index = {}
 
         if not isinstance(self.airdrop_data, dict):
+            self.container_list = None
             return
 
         containers = None
-        # Try common schema keys
-        for key in ("AirdropContainers", "Containers", "m_AirdropContainers"):
-            if key in self.airdrop_data and isinstance(self.airdrop_data[key], list):
-                containers = self.airdrop_data[key]
-                break
+        # Same data as last time (e.g. after remove_airdrop): reuse the list
+        key = self._containers_key
+        if key is not None and self.container_list is not None and self.airdrop_data.get(key) is self.container_list:
+            containers = self.container_list
+        else:
+            self.container_list = None
+            self._containers_key = None
+
+        if containers is None:
+            # Try common schema keys
+            for key in ("AirdropContainers", "Containers", "m_AirdropContainers"):
+                if key in self.airdrop_data and isinstance(self.airdrop_data[key], list):
+                    containers = self.airdrop_data[key]
+                    break
 
         if containers is None:
             # fallback: scan for list of dicts w/ Loot
             for k, v in self.airdrop_data.items():
                 if isinstance(v, list) and v and isinstance(v[0], dict) and ("Loot" in v[0] or "m_Loot" in v[0]):
                     containers = v
+                    key = k
                     break
 
         if containers is None:
             return
+        # Kept so add_airdrop and later re-indexes don't have to find the list again
+        self.container_list = containers
+        self._containers_key = key
 
         for idx, c in enumerate(containers):
             if not isinstance(c, dict):
                 continue
-
-            name = c.get("Name") or c.get("ContainerName") or c.get("m_Name") or f"Container_{idx}"
-            # Some Expansion setups use "Container" classname for the crate type
-            container_class = c.get("Container") or c.get("ContainerType") or c.get("m_Container") or ""
-            label = f"{name}"
-            if container_class:
-                label = f"{name}  ({container_class})"
-
+            label = self._container_label(c, idx)
             self.container_names.append(label)
             self.container_index[label] = {"ref": c, "idx": idx, "list_ref": containers}
 
         self.container_names.sort(key=str.lower)
 
+    @staticmethod
+    def _container_label(c: dict, idx: int):
+        name = c.get("Name") or c.get("ContainerName") or f"Container_{idx}"
+        # Some Expansion setups use "Container" classname for the crate type
+        container_class = c.get("Container") or c.get("ContainerType") or ""
+        label = f"{name}"
+        if container_class:
+            label = f"{name}  ({container_class})"
+        return label
+
+    def _append_container(self, containers: list, c: dict):
+        # Appending leaves every existing index valid, so only the new
+        # container is indexed (same order a full _index_containers gives)
+        containers.append(c)
+        idx = len(containers) - 1
+        label = self._container_label(c, idx)
+        insort(self.container_names, label, key=str.lower)
+        self.container_index[label] = {"ref": c, "idx": idx, "list_ref": containers}
+
     def _refresh_container_dropdown(self):
         if not self.container_names:
             self.dd_container.configure(values=["Load airdrop file first"])
@@ -1085,9 +1968,9 @@ class ExpansionAirdropLootBuilder(ctk.CTk):
         container = self.container_index[selected]["ref"]
 
         # pull settings to UI (these are NOT applied until Save)
-        itemcount = container.get("ItemCount", container.get("m_ItemCount", ""))
-        infected = container.get("Infected", container.get("m_Infected", True))
-        infcount = container.get("InfectedCount", container.get("m_InfectedCount", ""))
+        itemcount = container.get("ItemCount", "")
+        infected = container.get("Infected", True)
+        infcount = container.get("InfectedCount", "")
 
         self.var_item_count.set("" if itemcount is None else str(itemcount))
         self.var_infected_enabled.set(bool(infected))
@@ -1096,6 +1979,9 @@ class ExpansionAirdropLootBuilder(ctk.CTk):
         self._load_loot_tree(container)
 
     def _clear_loot_tree(self):
+        # Stop a pending / half-done fill so it can't add the old rows back
+        self._cancel_loot_job()
+        self._loot_fill = None
         self.loot_tree.delete(*self.loot_tree.get_children())
         self.selected_loot_index = None
         self._clear_loot_editor()
@@ -1108,10 +1994,9 @@ class ExpansionAirdropLootBuilder(ctk.CTk):
         self.var_qty.set("")
 
     def _get_container_loot_list(self, container: dict):
-        # loot key variations
-        for key in ("Loot", "m_Loot"):
-            if key in container and isinstance(container[key], list):
-                return container[key], key
+        # (m_Loot was renamed at load, see _normalize_containers)
+        if isinstance(container.get("Loot"), list):
+            return container["Loot"], "Loot"
         # create if missing
         container["Loot"] = []
         return container["Loot"], "Loot"
@@ -1126,23 +2011,82 @@ class ExpansionAirdropLootBuilder(ctk.CTk):
     def _loot_insert_step(self):
         self._loot_job = None
 
-        loot = getattr(self, "_loot_cache", [])
         self.loot_tree.delete(*self.loot_tree.get_children())
+        self._loot_fill = (0, 0)
+        self._loot_insert_chunk()
 
-        if not loot:
+    def _loot_insert_chunk(self):
+        # Inserts the next LOOT_CHUNK_ROWS entries, then yields to Tk so a
+        # big container fills in without freezing the window
+        self._loot_job = None
+        if self._loot_fill is None:
             return
+        start, n = self._loot_fill
+        loot = getattr(self, "_loot_cache", [])
+        end = min(start + LOOT_CHUNK_ROWS, len(loot))
+        n = self._insert_loot_rows(start, end, n)
+        if end < len(loot):
+            self._loot_fill = (end, n)
+            self._loot_job = self.after_idle(self._loot_insert_chunk)
+        else:
+            self._loot_fill = None
+
+    @staticmethod
+    def _loot_row_values(row: dict):
+        get = row.get  # one attribute lookup instead of five
+        return (
+            get("Name", ""),
+            get("Chance", 0),
+            get("Min", 0),
+            get("Max", 0),
+            get("QuantityPercent", 0),
+        )
 
-        for row in loot:
-            if not isinstance(row, dict):
-                continue
-            name = row.get("Name", row.get("m_Name", ""))
-            chance = row.get("Chance", row.get("m_Chance", 0))
-            mn = row.get("Min", row.get("m_Min", 0))
-            mx = row.get("Max", row.get("m_Max", 0))
-            qty = row.get("QuantityPercent", row.get("m_QuantityPercent", 0))
-            self.loot_tree.insert("", "end", values=(name, chance, mn, mx, qty))
+    def _insert_loot_rows(self, start: int, end: int, n: int):
+        # Appends loot[start:end] to the table; n = rows already shown above
+        # it. Returns the new row count.
+        # Zebra tags go on at insert time instead of a second re-tag pass;
+        # raw Tcl inserts skip ttk's per-call option formatting
+        loot = getattr(self, "_loot_cache", [])
+        call = self.loot_tree.tk.call
+        w = self.loot_tree._w
+        values = self._loot_row_values
+        zebra = ZEBRA_TAGS
+        # iid = index into the loot list, so selection maps straight back
+        # (rows are all dicts, see drop_non_dict_rows)
+        for i in range(start, end):
+            call(w, "insert", "", "end", "-id", i, "-values", values(loot[i]), "-tags", zebra[n & 1])
+            n += 1
+        return n
+
+    def _update_loot_rows(self, start: int):
+        """
+        Re-syncs the table from loot index start down, after the loot list
+        changed there. Rows above start are left alone.
+        """
+        if self._loot_job is not None and self._loot_fill is None:
+            # Initial fill not started yet; it will read the current list
+            return
+        tree = self.loot_tree
+        children = tree.get_children()
+        # Items are in loot order, so the ones to replace are a suffix
+        keep = len(children)
+        while keep and int(children[keep - 1]) >= start:
+            keep -= 1
+        if keep < len(children):
+            tree.delete(*children[keep:])
+        if self._loot_fill is not None:
+            # Fill still running: rewind it if it already got past start
+            if start < self._loot_fill[0]:
+                self._loot_fill = (start, keep)
+            return
+        self._loot_fill = (start, keep)
+        self._loot_insert_chunk()
 
-        self._reset_tree_zebra(self.loot_tree)
+    def _set_loot_row(self, idx: int):
+        # One row's values changed in place (same index, same zebra tag)
+        if self.loot_tree.exists(str(idx)):
+            self.loot_tree.item(str(idx), values=self._loot_row_values(self._loot_cache[idx]))
 
     def on_loot_select(self):
         sel = self.loot_tree.selection()
@@ -1153,35 +2097,14 @@ class ExpansionAirdropLootBuilder(ctk.CTk):
         if not vals:
             return
 
-        # Find index in loot list by matching Name + fields (best-effort)
         name = str(vals[0])
         chance = str(vals[1])
         mn = str(vals[2])
         mx = str(vals[3])
         qty = str(vals[4])
 
-        idx = None
-        container = self._get_current_container()
-        if container:
-            loot, _ = self._get_container_loot_list(container)
-            for i, row in enumerate(loot):
-                if not isinstance(row, dict):
-                    continue
-                rname = str(row.get("Name", row.get("m_Name", "")))
-                if rname != name:
-                    continue
-                # best effort match
-                if str(row.get("Chance", row.get("m_Chance", ""))) == chance and str(row.get("Min", row.get("m_Min", ""))) == mn:
-                    idx = i
-                    break
-            if idx is None:
-                # fallback: first matching name
-                for i, row in enumerate(loot):
-                    if isinstance(row, dict) and str(row.get("Name", row.get("m_Name", ""))) == name:
-                        idx = i
-                        break
-
-        self.selected_loot_index = idx
+        # Rows are inserted with iid = their index in the loot list
+        self.selected_loot_index = int(iid)
 
         self.var_name.set(name)
         self.var_chance.set(chance)
@@ -1200,14 +2123,11 @@ class ExpansionAirdropLootBuilder(ctk.CTk):
             messagebox.showwarning("No container", "Load an airdrop file and select a container first.")
             return
 
-        sel = self.item_tree.selection()
-        if not sel:
+        row = self.item_view.selected_row()
+        if row is None:
             messagebox.showinfo("Select item", "Select a classname in the Item Browser first.")
             return
-
-        classname = self.item_tree.item(sel[0], "values")[0]
-        if not classname:
-            return
+        classname = self.all_items[row]
 
         loot, loot_key = self._get_container_loot_list(container)
 
@@ -1222,7 +2142,7 @@ class ExpansionAirdropLootBuilder(ctk.CTk):
         loot.append(row)
         container[loot_key] = loot
 
-        self._load_loot_tree(container)
+        self._update_loot_rows(len(loot) - 1)
 
     def apply_loot_edit(self):
         container = self._get_current_container()
@@ -1237,9 +2157,6 @@ class ExpansionAirdropLootBuilder(ctk.CTk):
             return
 
         row = loot[self.selected_loot_index]
-        if not isinstance(row, dict):
-            return
-
         row["Name"] = self.var_name.get().strip()
         # Keep floats as floats where possible
         try:
@@ -1254,7 +2171,7 @@ class ExpansionAirdropLootBuilder(ctk.CTk):
         loot[self.selected_loot_index] = row
         container[loot_key] = loot
 
-        self._load_loot_tree(container)
+        self._set_loot_row(self.selected_loot_index)
 
     def remove_loot(self):
         container = self._get_current_container()
@@ -1264,13 +2181,15 @@ class ExpansionAirdropLootBuilder(ctk.CTk):
             return
 
         loot, loot_key = self._get_container_loot_list(container)
-        if 0 <= self.selected_loot_index < len(loot):
-            del loot[self.selected_loot_index]
+        idx = self.selected_loot_index
+        if 0 <= idx < len(loot):
+            del loot[idx]
         container[loot_key] = loot
 
         self.selected_loot_index = None
         self._clear_loot_editor()
-        self._load_loot_tree(container)
+        # Rows below shift up one index (iid) and zebra slot
+        self._update_loot_rows(idx)
 
     def move_loot(self, direction: int):
         container = self._get_current_container()
@@ -1284,12 +2203,13 @@ class ExpansionAirdropLootBuilder(ctk.CTk):
         loot[i], loot[j] = loot[j], loot[i]
         container[loot_key] = loot
         self.selected_loot_index = j
-        self._load_loot_tree(container)
-        # reselect visually
-        kids = self.loot_tree.get_children()
-        if 0 <= j < len(kids):
-            self.loot_tree.selection_set(kids[j])
-            self.loot_tree.see(kids[j])
+        # Both rows stay where they are; only their values trade places
+        self._set_loot_row(i)
+        self._set_loot_row(j)
+        # reselect visually (iid = loot index)
+        if self.loot_tree.exists(str(j)):
+            self.loot_tree.selection_set(str(j))
+            self.loot_tree.see(str(j))
 
     def apply_container_settings(self):
         # This just updates the UI status (actual commit happens on Save)
@@ -1305,10 +2225,7 @@ class ExpansionAirdropLootBuilder(ctk.CTk):
             ic = self.var_item_count.get().strip()
             if ic == "":
                 # remove if exists
-                if "ItemCount" in container:
-                    container.pop("ItemCount", None)
-                if "m_ItemCount" in container:
-                    container.pop("m_ItemCount", None)
+                container.pop("ItemCount", None)
             else:
                 container["ItemCount"] = safe_int(ic, 0)
         except Exception:
@@ -1322,10 +2239,7 @@ class ExpansionAirdropLootBuilder(ctk.CTk):
         try:
             infc = self.var_infected_count.get().strip()
             if infc == "":
-                if "InfectedCount" in container:
-                    container.pop("InfectedCount", None)
-                if "m_InfectedCount" in container:
-                    container.pop("m_InfectedCount", None)
+                container.pop("InfectedCount", None)
             else:
                 container["InfectedCount"] = safe_int(infc, 0)
         except Exception:
@@ -1341,14 +2255,7 @@ class ExpansionAirdropLootBuilder(ctk.CTk):
             return
 
         container_class = simpledialog.askstring("Add Airdrop", "Container classname (optional):", initialvalue="")
-        # Find list of containers
-        any_key = None
-        containers = None
-        for key in ("AirdropContainers", "Containers", "m_AirdropContainers"):
-            if key in self.airdrop_data and isinstance(self.airdrop_data[key], list):
-                any_key = key
-                containers = self.airdrop_data[key]
-                break
+        containers = self.container_list
         if containers is None:
             messagebox.showerror("Schema", "Could not find container list in this AirdropSettings.json.")
             return
@@ -1361,10 +2268,7 @@ class ExpansionAirdropLootBuilder(ctk.CTk):
             "InfectedCount": 0,
             "Loot": []
         }
-        containers.append(new_c)
-        self.airdrop_data[any_key] = containers
-
-        self._index_containers()
+        self._append_container(containers, new_c)
         self._refresh_container_dropdown()
 
     def clone_airdrop(self):
@@ -1377,11 +2281,9 @@ class ExpansionAirdropLootBuilder(ctk.CTk):
 
         # find container list ref
         list_ref = self.container_index[self.current_container_key]["list_ref"]
-        new_c = json.loads(json.dumps(container))  # deep copy
+        new_c = copy_json_tree(container)
         new_c["Name"] = name
-        list_ref.append(new_c)
-
-        self._index_containers()
+        self._append_container(list_ref, new_c)
         self._refresh_container_dropdown()
 
     def remove_airdrop(self):
@@ -1421,21 +2323,30 @@ class ExpansionAirdropLootBuilder(ctk.CTk):
     def _update_market_path_label(self):
         if hasattr(self, "lbl_market_path"):
             if self.market_path:
-                self.lbl_market_path.configure(text=f"Market: {os.path.basename(self.market_path)}")
-            elif isinstance(self.market_data, dict):
-                self.lbl_market_path.configure(text="Market: (unsaved new category)")
+                text = f"Market: {os.path.basename(self.market_path)}"
+            elif self.market_data is not None:
+                text = "Market: (unsaved new category)"
             else:
-                self.lbl_market_path.configure(text="No market loaded.")
+                text = "No market loaded."
+            self._set_label_text(self.lbl_market_path, text)
 
     def _load_market_path(self, path: str, silent: bool = False):
         try:
-            with open(path, "r", encoding="utf-8") as f:
-                data = json.load(f)
+            data = read_json_file(path)
             if not isinstance(data, dict) or "Items" not in data:
                 raise ValueError("Not a valid Expansion Market category JSON (missing Items).")
+            items = data["Items"]
+            lcs = []
+            if isinstance(items, list):
+                drop_non_dict_rows(items)
+                fill_market_defaults(items)
+                lcs = [str(row.get("ClassName", "")).lower() for row in items]
             self.market_data = data
+            self._market_lc = lcs
+            self._rebuild_market_index()
             self.market_path = path
             self.market_dirty = False
+            self._market_version += 1
             self._remember_market_path(path)
             self._update_market_path_label()
             self.refresh_market_tree()
@@ -1473,46 +2384,45 @@ class ExpansionAirdropLootBuilder(ctk.CTk):
             "InitStockPercent": 75.0,
             "Items": []
         }
+        self._market_lc = []
+        self._market_index = {}
         self.market_path = ""
         self.market_dirty = True
+        self._market_version += 1
         self.cfg["new_market_filename_hint"] = file_hint
         self._save_config()
         self._update_market_path_label()
         self.refresh_market_tree()
 
     def save_market(self):
-        if not isinstance(self.market_data, dict):
+        if self.market_data is None:
             messagebox.showwarning("No Market", "Load or create a market category first.")
             return
         if not self.market_path:
             self.save_market_as()
             return
-        try:
-            if os.path.isfile(self.market_path):
-                ts = time.strftime("%Y%m%d_%H%M%S")
-                bak = f"{self.market_path}.bak_{ts}"
-                try:
-                    shutil.copy2(self.market_path, bak)
-                except Exception:
-                    bak = None
-            else:
-                bak = None
-
-            with open(self.market_path, "w", encoding="utf-8") as f:
-                json.dump(self.market_data, f, indent=2)
+        path = self.market_path
 
-            self.market_dirty = False
-            self._remember_market_path(self.market_path)
+        def done(bak, err):
+            if err is not None:
+                # Edits made since the click are unsaved too
+                self.market_dirty = True
+                messagebox.showerror("Market Save Error", str(err))
+                return
+            self._remember_market_path(path)
             self._update_market_path_label()
-            msg = f"Saved: {os.path.basename(self.market_path)}"
+            msg = f"Saved: {os.path.basename(path)}"
             if bak:
                 msg += f"\nBackup: {os.path.basename(bak)}"
             messagebox.showinfo("Market Saved", msg)
-        except Exception as e:
-            messagebox.showerror("Market Save Error", str(e))
+
+        # Cleared now: the save writes a copy taken at this click, so any edit
+        # made after it marks the market dirty again
+        self.market_dirty = False
+        self._save_in_background(path, self.market_data, done)
 
     def save_market_as(self):
-        if not isinstance(self.market_data, dict):
+        if self.market_data is None:
             messagebox.showwarning("No Market", "Load or create a market category first.")
             return
 
@@ -1538,97 +2448,133 @@ class ExpansionAirdropLootBuilder(ctk.CTk):
         self._remember_market_path(path)
         self.save_market()
 
+    def refresh_market_types_filter(self):
+        self._cancel_market_types_job()
+        # debounce redraw, same as the Airdrops item browser
+        self._market_types_job = self.after(SEARCH_DEBOUNCE_MS, self._refresh_market_types_list)
+
     def _refresh_market_types_list(self):
-        if not hasattr(self, "mkt_types_tree"):
+        self._cancel_market_types_job()
+        if not hasattr(self, "mkt_types_view"):
             return
-        for it in self.mkt_types_tree.get_children():
-            self.mkt_types_tree.delete(it)
 
         q = (self.var_market_search.get() or "").strip().lower()
-        if not self.all_items:
+        if q == self._last_market_query:
             return
-
-        max_rows = 1200 if q else 600
-        count = 0
-        for name in self.all_items:
-            if q and q not in name.lower():
-                continue
-            src = ""
-            meta = self.item_meta.get(name)
-            if isinstance(meta, dict):
-                src = meta.get("source", "")
-            self.mkt_types_tree.insert("", "end", values=(name, src))
-            count += 1
-            if count >= max_rows:
-                break
+        self._last_market_query = q
+        if q:
+            rows = self._names_containing(q)
+        else:
+            rows = range(len(self.all_items))
+        self.mkt_types_view.set_rows(rows)
 
     def refresh_market_tree(self):
         if not hasattr(self, "market_tree"):
             return
-        for it in self.market_tree.get_children():
-            self.market_tree.delete(it)
+        if self._market_tree_version == self._market_version:
+            return
+        self._market_tree_version = self._market_version
+        children = self.market_tree.get_children()
+        if children:
+            self.market_tree.delete(*children)
 
-        if not isinstance(self.market_data, dict):
+        if self.market_data is None:
             return
         items = self.market_data.get("Items") or []
         if not isinstance(items, list):
             return
 
+        call = self.market_tree.tk.call
+        w = self.market_tree._w
+        zebra = ZEBRA_TAGS
+        # iid = index into Items, so a selection maps straight back to rows
+        n = 0
         for row in items:
-            if not isinstance(row, dict):
-                continue
-            cn = str(row.get("ClassName", ""))
-            minp = row.get("MinPriceThreshold", "")
-            maxp = row.get("MaxPriceThreshold", "")
-            minst = row.get("MinStockThreshold", "")
-            maxst = row.get("MaxStockThreshold", "")
-            self.market_tree.insert("", "end", values=(cn, minp, maxp, minst, maxst))
+            get = row.get
+            cn = str(get("ClassName", ""))
+            minp = get("MinPriceThreshold", "")
+            maxp = get("MaxPriceThreshold", "")
+            minst = get("MinStockThreshold", "")
+            maxst = get("MaxStockThreshold", "")
+            call(w, "insert", "", "end", "-id", n, "-values", (cn, minp, maxp, minst, maxst), "-tags", zebra[n & 1])
+            n += 1
+
+    def _schedule_market_refresh(self):
+        # Market edits only mark the table stale; one idle-time rebuild covers
+        # however many edits ran before Tk got back to its event loop
+        if self._market_refresh_job is None:
+            self._market_refresh_job = self.after_idle(self._run_market_refresh)
+
+    def _run_market_refresh(self):
+        self._market_refresh_job = None
+        self.refresh_market_tree()
 
     def _on_market_select(self):
         sel = self.market_tree.selection()
-        if not sel:
+        if not sel or self.market_data is None:
             return
-        vals = self.market_tree.item(sel[0], "values")
-        if not vals:
+        # iid = index into Items: read the row itself, no Tcl item() round-trip
+        items = self.market_data["Items"]
+        idx = int(sel[0])
+        if idx >= len(items):
             return
-        self.var_m_class.set(vals[0])
-        self.var_m_minp.set(str(vals[1]))
-        self.var_m_maxp.set(str(vals[2]))
-        self.var_m_minst.set(str(vals[3]))
-        self.var_m_maxst.set(str(vals[4]))
+        get = items[idx].get
+        self.var_m_class.set(str(get("ClassName", "")))
+        self.var_m_minp.set(str(get("MinPriceThreshold", "")))
+        self.var_m_maxp.set(str(get("MaxPriceThreshold", "")))
+        self.var_m_minst.set(str(get("MinStockThreshold", "")))
+        self.var_m_maxst.set(str(get("MaxStockThreshold", "")))
+
+    def _rebuild_market_index(self):
+        # Only needed when rows are loaded or shift position. Built back to
+        # front so a duplicated name ends up pointing at its first row.
+        lcs = self._market_lc
+        self._market_index = dict(zip(reversed(lcs), range(len(lcs) - 1, -1, -1)))
 
     def _market_find_index_by_class(self, classname: str):
-        if not isinstance(self.market_data, dict):
-            return None
-        items = self.market_data.get("Items") or []
-        if not isinstance(items, list):
-            return None
-        target = classname.lower()
-        for i, row in enumerate(items):
-            if isinstance(row, dict) and str(row.get("ClassName", "")).lower() == target:
-                return i
-        return None
+        return self._market_index.get(classname.lower())
+
+    def _read_market_form(self, default_minp=None):
+        """
+        Reads the price / stock fields once: (minp, maxp, minst, maxst).
+        Blank or non-numeric fields get the editor defaults; MinPrice defaults
+        to half of MaxPrice unless default_minp is given.
+        """
+        maxp = safe_int(self.var_m_maxp.get(), 10)
+        minp = safe_int(self.var_m_minp.get(), max(1, maxp // 2) if default_minp is None else default_minp)
+        minst = safe_int(self.var_m_minst.get(), 0)
+        maxst = safe_int(self.var_m_maxst.get(), 100)
+        return minp, maxp, minst, maxst
 
     def market_add_selected_from_types(self):
-        if not isinstance(self.market_data, dict):
+        if self.market_data is None:
             messagebox.showwarning("No Market", "Load or create a market category first.")
             return
-        sel = self.mkt_types_tree.selection()
-        if not sel:
+        rows = self.mkt_types_view.selected_rows()
+        if not rows:
             messagebox.showinfo("Select Item", "Select a classname from the Types list first.")
             return
-        classname = self.mkt_types_tree.item(sel[0], "values")[0]
 
-        if self._market_find_index_by_class(classname) is not None:
-            messagebox.showinfo("Already Exists", f"{classname} is already in this market category.")
+        # Skip names already in the category (or picked twice in this batch)
+        index = self._market_index
+        new = {}
+        for row in rows:
+            classname = self.all_items[row]
+            lc = classname.lower()
+            if lc not in index and lc not in new:
+                new[lc] = classname
+        if not new:
+            if len(rows) == 1:
+                messagebox.showinfo("Already Exists", f"{self.all_items[rows[0]]} is already in this market category.")
+            else:
+                messagebox.showinfo("Already Exists", "All selected classnames are already in this market category.")
             return
 
-        maxp = safe_int(self.var_m_maxp.get(), 10)
-        minp = safe_int(self.var_m_minp.get(), max(1, maxp // 2))
-        maxst = safe_int(self.var_m_maxst.get(), 100)
-        minst = safe_int(self.var_m_minst.get(), 0)
+        minp, maxp, minst, maxst = self._read_market_form()
 
-        entry = {
+        items = self.market_data["Items"]
+        start = len(items)
+        items.extend({
             "ClassName": classname,
             "MaxPriceThreshold": maxp,
             "MinPriceThreshold": minp,
@@ -1638,13 +2584,15 @@ class ExpansionAirdropLootBuilder(ctk.CTk):
             "QuantityPercent": -1,
             "SpawnAttachments": [],
             "Variants": []
-        }
-        self.market_data["Items"].append(entry)
+        } for classname in new.values())
+        self._market_lc.extend(new)
+        index.update(zip(new, range(start, len(items))))
         self.market_dirty = True
-        self.refresh_market_tree()
+        self._market_version += 1
+        self._schedule_market_refresh()
 
     def market_apply_edit(self):
-        if not isinstance(self.market_data, dict):
+        if self.market_data is None:
             return
         classname = (self.var_m_class.get() or "").strip()
         if not classname:
@@ -1655,39 +2603,51 @@ class ExpansionAirdropLootBuilder(ctk.CTk):
             messagebox.showinfo("Not Found", "Selected classname not found in market list.")
             return
         row = self.market_data["Items"][idx]
+        minp, maxp, minst, maxst = self._read_market_form(default_minp=5)
+        get = row.get
+        if (get("ClassName"), get("MinPriceThreshold"), get("MaxPriceThreshold"),
+                get("MinStockThreshold"), get("MaxStockThreshold")) == (classname, minp, maxp, minst, maxst):
+            # Nothing changed: leave the version alone so the table isn't rebuilt
+            return
         row["ClassName"] = classname
-        row["MinPriceThreshold"] = safe_int(self.var_m_minp.get(), 5)
-        row["MaxPriceThreshold"] = safe_int(self.var_m_maxp.get(), 10)
-        row["MinStockThreshold"] = safe_int(self.var_m_minst.get(), 0)
-        row["MaxStockThreshold"] = safe_int(self.var_m_maxst.get(), 100)
-
-        row.setdefault("SellPricePercent", -1)
-        row.setdefault("QuantityPercent", -1)
-        row.setdefault("SpawnAttachments", [])
-        row.setdefault("Variants", [])
+        row["MinPriceThreshold"] = minp
+        row["MaxPriceThreshold"] = maxp
+        row["MinStockThreshold"] = minst
+        row["MaxStockThreshold"] = maxst
 
         self.market_dirty = True
-        self.refresh_market_tree()
+        self._market_version += 1
+        self._schedule_market_refresh()
 
     def market_remove_selected(self):
-        if not isinstance(self.market_data, dict):
+        if self.market_data is None:
             return
+        # iids are indices into Items; a pending refresh doesn't change that,
+        # and flushing it first could rebuild the table and drop the selection
         sel = self.market_tree.selection()
         if not sel:
             return
-        vals = self.market_tree.item(sel[0], "values")
-        if not vals:
-            return
-        classname = vals[0]
-        idx = self._market_find_index_by_class(classname)
-        if idx is None:
-            return
-        del self.market_data["Items"][idx]
+        items = self.market_data["Items"]
+        drop = {int(iid) for iid in sel}
+        if len(drop) == 1:
+            idx = next(iter(drop))
+            if idx >= len(items):
+                return
+            del items[idx]
+            del self._market_lc[idx]
+        else:
+            # One pass over the list instead of a del (and tail shift) per row
+            items[:] = [r for i, r in enumerate(items) if i not in drop]
+            self._market_lc = [lc for i, lc in enumerate(self._market_lc) if i not in drop]
+        # Rows after the removed ones moved up
+        self._rebuild_market_index()
         self.market_dirty = True
-        self.refresh_market_tree()
+        self._market_version += 1
+        self._schedule_market_refresh()
 
 # ---------------- Run ----------------
 
 if __name__ == "__main__":
+    multiprocessing.freeze_support()
     app = ExpansionAirdropLootBuilder()
     app.mainloop()